@@ -0,0 +1,77 @@
+# KalKalori — Heat Exchanger Open Engine
+# GNU GPL v3 only
+
+"""
+Optional Numba acceleration for numeric kernels.
+
+Numba is an optional dependency (``pip install kalkalori[jit]``).
+When it is available, `njit` compiles the decorated function to native
+code; with ``cache=True`` the compiled artifact is stored next to the
+module and reused across interpreter sessions.
+
+Without Numba, `njit` returns the function unchanged, so the same
+pure-Python implementation runs. Numerical results agree to
+floating-point rounding in both cases (last-bit differences are possible
+where the two paths call different math routines, e.g. the cube root on
+Python 3.10).
+
+`prange` is `numba.prange` (parallel loop over iterations inside
+``@njit(parallel=True)`` functions) or the builtin `range` without Numba,
+so the same loop body runs serially in pure Python.
+
+`vectorize` (NumPy ufunc compilation) has no pure-Python equivalent
+worth using; it is only defined when `HAVE_NUMBA` is true, and callers
+keep a NumPy implementation for the fallback path.
+
+Set the environment variable ``KALKALORI_DISABLE_JIT=1`` to skip
+importing Numba altogether (no import overhead, no compilation or cache
+loading). This suits short-lived processes such as command-line tools
+that evaluate only a few operating points.
+
+Notes
+-----
+- ``fastmath`` is intentionally not used: it allows the compiler to
+  reorder floating-point operations, which changes results in the last
+  digits and is at odds with reproducible engineering output.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def _jit_disabled() -> bool:
+    return os.environ.get("KALKALORI_DISABLE_JIT", "").strip().lower() not in ("", "0", "false", "no")
+
+
+if _jit_disabled():
+    numba = None
+else:
+    try:
+        import numba
+    except ImportError:  # pragma: no cover - depends on environment
+        numba = None
+
+HAVE_NUMBA = numba is not None
+
+prange = numba.prange if numba is not None else range
+
+vectorize = numba.vectorize if numba is not None else None
+
+
+def njit(*args, **kwargs):
+    """
+    `numba.njit` when Numba is installed, otherwise a no-op decorator.
+
+    Supports both ``@njit`` and ``@njit(cache=True)`` forms.
+    """
+    if numba is not None:
+        return numba.njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func):
+        return func
+
+    return decorator
@@ -21,6 +21,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from core.geometry.tube import BaseTube
+from core.types import FlowArrangement
+
+_LAYOUTS = frozenset({"inline", "staggered"})
+
+# Canonical flow_arrangement strings -> ε–NTU tag (validation and parsing in one lookup)
+_FLOW_ARRANGEMENT_CODES = {fa.name.lower(): fa for fa in FlowArrangement}
 
 
 @dataclass(frozen=True)
@@ -42,8 +48,12 @@ class TubeBundle:
         Longitudinal pitch [m] (tube spacing in flow direction).
     layout : str
         "inline" or "staggered" (used later for refined outside correlations).
+        Case-insensitive; stored lowercase.
     n_passes_tube : int
         Number of tube-side passes (biegów).
+    flow_arrangement : str
+        "crossflow", "counterflow" or "cocurrentflow".
+        Case-insensitive; stored lowercase.
 
     Notes
     -----
@@ -51,6 +61,8 @@ class TubeBundle:
       must be provided explicitly.
     - MVP assumes equal partitioning of tubes among passes.
       Future: support explicit pass partition map (unequal passes).
+    - Tube counts and areas are computed once at construction; the bundle
+      (and its tube) are immutable.
     """
 
     tube: BaseTube
@@ -63,40 +75,88 @@ class TubeBundle:
     flow_arrangement: str
 
     def __post_init__(self) -> None:
-        if self.n_rows <= 0 or self.n_tubes_per_row <= 0:
-            raise ValueError("n_rows and n_tubes_per_row must be positive integers.")
-        if self.pitch_transverse <= 0.0 or self.pitch_longitudinal <= 0.0:
-            raise ValueError("pitch_transverse and pitch_longitudinal must be positive.")
-        if self.n_passes_tube <= 0:
-            raise ValueError("n_passes_tube must be a positive integer.")
-        if self.layout.lower() not in ("inline", "staggered"):
-            raise ValueError("layout must be 'inline' or 'staggered'.")
-        if self.flow_arrangement.lower() not in ("crossflow", "counterflow", "cocurrentflow"):
-            raise ValueError("flow_arrangement must be 'crossflow', 'counterflow', or 'cocurrentflow'.")
-
-        if self.n_tubes_total % self.n_passes_tube != 0:
+        # Single composite test on the success path; the specific message is
+        # only worked out once validation has failed.
+        if not (
+            self.n_rows > 0
+            and self.n_tubes_per_row > 0
+            and self.pitch_transverse > 0.0
+            and self.pitch_longitudinal > 0.0
+            and self.n_passes_tube > 0
+        ):
+            raise self._validation_error()
+
+        # Canonical (lowercase) input skips the .lower() copy
+        layout = self.layout
+        if layout not in _LAYOUTS:
+            layout = layout.lower()
+            if layout not in _LAYOUTS:
+                raise ValueError("layout must be 'inline' or 'staggered'.")
+
+        flow_arrangement_code = _FLOW_ARRANGEMENT_CODES.get(self.flow_arrangement)
+        if flow_arrangement_code is None:
+            flow_arrangement_code = _FLOW_ARRANGEMENT_CODES.get(self.flow_arrangement.lower())
+            if flow_arrangement_code is None:
+                raise ValueError("flow_arrangement must be 'crossflow', 'counterflow', or 'cocurrentflow'.")
+
+        # Store canonical (lowercase) strings so consumers need not normalize
+        object.__setattr__(self, "layout", layout)
+        object.__setattr__(self, "flow_arrangement", flow_arrangement_code.name.lower())
+        object.__setattr__(self, "_flow_arrangement_code", flow_arrangement_code)
+
+        n_tubes_total = self.n_rows * self.n_tubes_per_row
+        if n_tubes_total % self.n_passes_tube != 0:
             raise ValueError(
                 "For MVP, total tube count must be divisible by n_passes_tube "
                 "(equal tube partitioning per pass)."
             )
 
+        # Cache derived quantities (frozen dataclass -> object.__setattr__)
+        n_tubes_per_pass = n_tubes_total // self.n_passes_tube
+        object.__setattr__(self, "_n_tubes_total", n_tubes_total)
+        object.__setattr__(self, "_n_tubes_per_pass", n_tubes_per_pass)
+        object.__setattr__(self, "_n_turns", max(self.n_passes_tube - 1, 0))
+        object.__setattr__(self, "_total_inner_area", n_tubes_total * self.tube.area_inner)
+        object.__setattr__(self, "_total_outer_area", n_tubes_total * self.tube.area_outer)
+        object.__setattr__(self, "_internal_flow_area_per_pass", n_tubes_per_pass * self.tube.flow_area)
+        object.__setattr__(self, "_internal_length_total", self.n_passes_tube * float(self.tube.length_total))
+        object.__setattr__(
+            self,
+            "_frontal_flow_area",
+            self.n_tubes_per_row * self.pitch_transverse * float(self.tube.length_effective),
+        )
+
+    def _validation_error(self) -> ValueError:
+        if self.n_rows <= 0 or self.n_tubes_per_row <= 0:
+            return ValueError("n_rows and n_tubes_per_row must be positive integers.")
+        if self.pitch_transverse <= 0.0 or self.pitch_longitudinal <= 0.0:
+            return ValueError("pitch_transverse and pitch_longitudinal must be positive.")
+        if self.n_passes_tube <= 0:
+            return ValueError("n_passes_tube must be a positive integer.")
+        return ValueError("Bundle counts and pitches must be finite numbers.")
+
+    @property
+    def flow_arrangement_code(self) -> FlowArrangement:
+        """Parsed `flow_arrangement` tag for ε–NTU dispatch."""
+        return self._flow_arrangement_code
+
     # -----------------------
     # Tube counts
     # -----------------------
 
     @property
     def n_tubes_total(self) -> int:
-        return self.n_rows * self.n_tubes_per_row
+        return self._n_tubes_total
 
     @property
     def n_tubes_per_pass(self) -> int:
         """Number of tubes in parallel within a single pass (MVP equal split)."""
-        return self.n_tubes_total // self.n_passes_tube
+        return self._n_tubes_per_pass
 
     @property
     def n_turns(self) -> int:
         """Number of 180° turns for n_passes (MVP): turns = passes - 1."""
-        return max(self.n_passes_tube - 1, 0)
+        return self._n_turns
 
     # -----------------------
     # Heat transfer areas (effective)
@@ -104,11 +164,11 @@ class TubeBundle:
 
     @property
     def total_inner_area(self) -> float:
-        return self.n_tubes_total * self.tube.area_inner
+        return self._total_inner_area
 
     @property
     def total_outer_area(self) -> float:
-        return self.n_tubes_total * self.tube.area_outer
+        return self._total_outer_area
 
     # -----------------------
     # Internal flow geometry (per pass)
@@ -117,7 +177,7 @@ class TubeBundle:
     @property
     def internal_flow_area_per_pass(self) -> float:
         """Total internal flow area within a single pass [m^2]."""
-        return self.n_tubes_per_pass * self.tube.flow_area
+        return self._internal_flow_area_per_pass
 
     @property
     def internal_hydraulic_diameter(self) -> float:
@@ -129,10 +189,7 @@ class TubeBundle:
         Total hydraulic length experienced by the fluid on the tube side [m].
         Includes multiple passes.
         """
-        tube = self.tube
-        if not hasattr(tube, "length_total"):
-            raise ValueError("Tube object must provide length_total.")
-        return self.n_passes_tube * float(getattr(tube, "length_total"))
+        return self._internal_length_total
 
     # -----------------------
     # Outside flow geometry (effective)
@@ -149,9 +206,4 @@ class TubeBundle:
 
         Blockage by tubes is neglected (to be refined later).
         """
-        tube = self.tube
-        if not hasattr(tube, "length_effective"):
-            raise ValueError("Tube object must provide length_effective.")
-        height = self.n_tubes_per_row * self.pitch_transverse
-        width = float(getattr(tube, "length_effective"))
-        return height * width
+        return self._frontal_flow_area
@@ -22,6 +22,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 import math
 
+_PI = math.pi
+_PI_QUARTER = 0.25 * math.pi
+
 
 @dataclass(frozen=True)
 class BaseTube:
@@ -33,6 +36,8 @@ class BaseTube:
     - hydraulic_diameter [m]
     - area_inner [m^2] (heat transfer area, effective length)
     - area_outer [m^2] (heat transfer area, effective length)
+    - length_total [m] (hydraulic length for tube-side pressure drop)
+    - length_effective [m] (length exposed to heat transfer and outside flow)
     """
     pass
 
@@ -63,6 +68,9 @@ class BareTube(BaseTube):
     -----------
     0 < length_effective <= length_total
     D_o > D_i > 0
+
+    Derived quantities (flow area, heat transfer areas) are computed once
+    at construction; the instance is immutable.
     """
 
     D_i: float
@@ -71,21 +79,33 @@ class BareTube(BaseTube):
     length_effective: float
 
     def __post_init__(self) -> None:
+        # Single composite test on the success path; the specific message is
+        # only worked out once validation has failed.
+        if not (0.0 < self.D_i < self.D_o and 0.0 < self.length_effective <= self.length_total):
+            raise self._validation_error()
+
+        # Cache derived geometry (frozen dataclass -> object.__setattr__)
+        object.__setattr__(self, "_flow_area", _PI_QUARTER * self.D_i * self.D_i)
+        object.__setattr__(self, "_area_inner", _PI * self.D_i * self.length_effective)
+        object.__setattr__(self, "_area_outer", _PI * self.D_o * self.length_effective)
+
+    def _validation_error(self) -> ValueError:
         if self.D_i <= 0.0 or self.D_o <= 0.0:
-            raise ValueError("Diameters must be positive.")
+            return ValueError("Diameters must be positive.")
         if self.D_o <= self.D_i:
-            raise ValueError("Outer diameter must be greater than inner diameter.")
+            return ValueError("Outer diameter must be greater than inner diameter.")
         if self.length_total <= 0.0:
-            raise ValueError("length_total must be positive.")
+            return ValueError("length_total must be positive.")
         if self.length_effective <= 0.0:
-            raise ValueError("length_effective must be positive.")
+            return ValueError("length_effective must be positive.")
         if self.length_effective > self.length_total:
-            raise ValueError("length_effective must not exceed length_total.")
+            return ValueError("length_effective must not exceed length_total.")
+        return ValueError("Tube dimensions must be finite numbers.")
 
     @property
     def flow_area(self) -> float:
         """Internal flow cross-sectional area [m^2]."""
-        return math.pi * (self.D_i ** 2) / 4.0
+        return self._flow_area
 
     @property
     def hydraulic_diameter(self) -> float:
@@ -95,12 +115,12 @@ class BareTube(BaseTube):
     @property
     def area_inner(self) -> float:
         """Inner heat transfer area using length_effective [m^2]."""
-        return math.pi * self.D_i * self.length_effective
+        return self._area_inner
 
     @property
     def area_outer(self) -> float:
         """Outer heat transfer area using length_effective [m^2]."""
-        return math.pi * self.D_o * self.length_effective
+        return self._area_outer
 
 
 # TODO class FinnedTube(BaseTube):
@@ -7,58 +7,106 @@ Heat transfer correlations and helper functions.
 This package contains low-level, reusable building blocks.
 """
 
-from .ntu import effectiveness_ntu, heat_duty_from_effectiveness
+from .ntu import (
+    FlowArrangement,
+    effectiveness_ntu,
+    effectiveness_ntu_isothermal,
+    effectiveness_ntu_vec,
+    heat_duty_from_effectiveness,
+    heat_duty_from_effectiveness_vec,
+)
 
 from .streams import (
     EnergyStream,
     SensibleHeatStream,
     CondensingSteamStream,
     MoistAirStream,
+    StreamKind,
+    StreamSpec,
 )
 
+from .fluid_props import FluidProps
+
 from .internal_flow import (
     FluidProps as InternalFlowFluidProps,
+    FluidPropsArray,
+    InternalFlowResult,
+    ThermoHydraulicResult,
     heat_transfer_coefficient_internal,
+    heat_transfer_coefficient_internal_h_only,
+    thermo_hydraulic_internal,
 )
 
 from .internal_pressure_drop import (
     FluidProps as InternalPressureDropFluidProps,
+    InternalPressureDropResult,
     pressure_drop_internal_total,
+    pressure_drop_internal_total_dp_only,
+    pressure_drop_internal_total_vec,
     pressure_drop_tubes,
     pressure_drop_inlet,
     pressure_drop_outlet,
     pressure_drop_turns,
 )
 
+from .sweeps import design_sweep, sweep_designs
+
 from .outside_flow import (
     FluidProps as OutsideFlowFluidProps,
     outside_flow_from_mass_flow,
+    outside_flow_from_mass_flow_vec,
+    outside_flow_h_dp,
+    outside_flow_velocity_reynolds,
 )
 
 __all__ = [
     # NTU
+    "FlowArrangement",
     "effectiveness_ntu",
+    "effectiveness_ntu_isothermal",
+    "effectiveness_ntu_vec",
     "heat_duty_from_effectiveness",
+    "heat_duty_from_effectiveness_vec",
 
     # Streams
     "EnergyStream",
     "SensibleHeatStream",
     "CondensingSteamStream",
     "MoistAirStream",
+    "StreamKind",
+    "StreamSpec",
+
+    # Fluid properties (shared by all flow correlations)
+    "FluidProps",
 
     # Internal flow
     "InternalFlowFluidProps",
+    "FluidPropsArray",
+    "InternalFlowResult",
+    "ThermoHydraulicResult",
     "heat_transfer_coefficient_internal",
+    "heat_transfer_coefficient_internal_h_only",
+    "thermo_hydraulic_internal",
 
     # Internal pressure drop (component-based)
     "InternalPressureDropFluidProps",
+    "InternalPressureDropResult",
     "pressure_drop_internal_total",
+    "pressure_drop_internal_total_dp_only",
+    "pressure_drop_internal_total_vec",
     "pressure_drop_tubes",
     "pressure_drop_inlet",
     "pressure_drop_outlet",
     "pressure_drop_turns",
 
+    # Design sweeps
+    "design_sweep",
+    "sweep_designs",
+
     # Outside flow (mass-flow driven)
     "OutsideFlowFluidProps",
     "outside_flow_from_mass_flow",
+    "outside_flow_from_mass_flow_vec",
+    "outside_flow_velocity_reynolds",
+    "outside_flow_h_dp",
 ]
@@ -0,0 +1,46 @@
+# KalKalori — Heat Exchanger Open Engine
+# Copyright (C) 2025  KalKalori Project Authors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# NOTE ON UNITS
+# -------------
+# SI units:
+# - rho [kg/m^3], mu [Pa*s], k [W/(m*K)], cp [J/(kg*K)]
+
+"""
+Single-phase fluid property container shared by the flow correlations.
+
+One `FluidProps` instance describes a fluid state for the tube-side thermal
+(`internal_flow`) and hydraulic (`internal_pressure_drop`) correlations as
+well as for the outside-flow correlations (`outside_flow`).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class FluidProps:
+    """
+    Thermophysical properties of a single-phase fluid state.
+
+    `k` and `cp` are only needed for heat transfer; they default to NaN so a
+    hydraulics-only state can be built from `rho` and `mu` alone. Thermal
+    correlations reject NaN values as non-positive.
+    """
+    rho: float                # [kg/m^3]
+    mu: float                 # [Pa*s]
+    k: float = float("nan")   # [W/(m*K)]
+    cp: float = float("nan")  # [J/(kg*K)]
@@ -32,7 +32,10 @@ This module provides:
 - Reynolds and Prandtl numbers,
 - Darcy friction factor correlations for smooth tubes,
 - Nusselt number correlations for laminar and turbulent regimes,
-- a convenience function returning h (heat transfer coefficient).
+- a convenience function returning h (heat transfer coefficient),
+- a fused routine returning h and the frictional pressure drop in one pass,
+- NumPy-vectorized variants of the friction and Nusselt correlations
+  for parameter sweeps over many operating points.
 
 Theory references
 -----------------
@@ -54,52 +57,204 @@ Notes
 - Turbulent Nusselt: Gnielinski correlation is used with a smooth-tube
   friction factor.
 - Transitional regime is handled by linear blending in Re between 2300 and 4000.
+- Scalar correlations are compiled with Numba when it is installed
+  (see `core._jit`); otherwise they run as plain Python.
+- Public functions validate their inputs and delegate to unchecked private
+  kernels (`_*_fast`). Convenience functions validate once at the top and
+  then use the kernels only.
 """
 
 from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-
-
-@dataclass(frozen=True)
-class FluidProps:
+from typing import NamedTuple
+
+import numpy as np
+
+from core._jit import HAVE_NUMBA, njit, vectorize
+from core.heat_transfer.fluid_props import FluidProps
+
+# Cube root used for Pr^(2/3) = cbrt(Pr)^2 (one cbrt instead of exp/log pow).
+# Numba supports np.cbrt in nopython mode; math.cbrt exists from Python 3.11.
+if HAVE_NUMBA:
+    _cbrt = np.cbrt
+elif hasattr(math, "cbrt"):
+    _cbrt = math.cbrt
+else:
+    # Python 3.10 without Numba: may differ from libm cbrt in the last bit
+    def _cbrt(x: float) -> float:
+        return x ** (1.0 / 3.0)
+
+# Re-only factors of Gnielinski at the upper end of the transitional blend
+# (Re = 4000), folded once at import so the blend only evaluates the Pr terms.
+_F_OVER_8_4000 = 0.125 / (0.79 * math.log(4000.0) - 1.64) ** 2
+_GNIELINSKI_4000_NUM = _F_OVER_8_4000 * (4000.0 - 1000.0)
+_GNIELINSKI_4000_DEN = 12.7 * math.sqrt(_F_OVER_8_4000)
+
+
+class InternalFlowResult(NamedTuple):
+    """Result of `heat_transfer_coefficient_internal` (unpacks as a 4-tuple)."""
+    v: float    # [m/s]
+    Re: float   # [-]
+    Pr: float   # [-]
+    h: float    # [W/(m^2*K)]
+
+
+class ThermoHydraulicResult(NamedTuple):
+    """Result of `thermo_hydraulic_internal` (unpacks as a 7-tuple)."""
+    v: float            # [m/s]
+    Re: float           # [-]
+    Pr: float           # [-]
+    f: float            # [-] Darcy friction factor
+    Nu: float           # [-]
+    h: float            # [W/(m^2*K)]
+    dp_friction: float  # [Pa]
+
+
+@dataclass(frozen=True, eq=False)
+class FluidPropsArray:
     """
-    Minimal set of thermophysical properties required for tube-side correlations.
+    Structure-of-arrays counterpart of `FluidProps` for batched evaluation.
+
+    Holds one NumPy array per property instead of one `FluidProps` object per
+    state point. Fields accept scalars or arrays and are broadcast to a common
+    shape at construction.
     """
-    rho: float  # [kg/m^3]
-    mu: float   # [Pa*s]
-    k: float    # [W/(m*K)]
-    cp: float   # [J/(kg*K)]
+    rho: np.ndarray  # [kg/m^3]
+    mu: np.ndarray   # [Pa*s]
+    k: np.ndarray    # [W/(m*K)]
+    cp: np.ndarray   # [J/(kg*K)]
+
+    def __post_init__(self) -> None:
+        rho, mu, k, cp = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (self.rho, self.mu, self.k, self.cp))
+        )
+        # NaN fails `x > 0` here, as it does in the scalar correlations
+        if not (np.all(rho > 0.0) and np.all(mu > 0.0) and np.all(k > 0.0) and np.all(cp > 0.0)):
+            raise ValueError("rho, mu, k and cp must be positive.")
+
+        object.__setattr__(self, "rho", rho)
+        object.__setattr__(self, "mu", mu)
+        object.__setattr__(self, "k", k)
+        object.__setattr__(self, "cp", cp)
+
+    @classmethod
+    def from_props(cls, props: list[FluidProps]) -> FluidPropsArray:
+        """Build from a sequence of `FluidProps` (one per state point)."""
+        return cls(
+            rho=np.array([p.rho for p in props], dtype=float),
+            mu=np.array([p.mu for p in props], dtype=float),
+            k=np.array([p.k for p in props], dtype=float),
+            cp=np.array([p.cp for p in props], dtype=float),
+        )
+
+    def __len__(self) -> int:
+        return self.rho.size
+
+
+# -----------------------------
+# Unchecked kernels
+# -----------------------------
+# The _*_fast kernels perform no input validation: callers must guarantee
+# positive inputs. Public functions below validate their arguments once and
+# delegate to these kernels, so tight loops that have already validated
+# their inputs can call the kernels directly.
+
+@njit(cache=True, inline="always")
+def _reynolds_fast(rho: float, v: float, D: float, mu: float) -> float:
+    return rho * v * D / mu
+
+
+@njit(cache=True, inline="always")
+def _prandtl_fast(cp: float, mu: float, k: float) -> float:
+    return cp * mu / k
+
+
+@njit(cache=True, inline="always")
+def _mean_velocity_fast(m_dot: float, rho: float, flow_area: float) -> float:
+    return m_dot / (rho * flow_area)
 
 
+@njit(cache=True, inline="always")
+def _friction_factor_fast(Re: float) -> float:
+    if Re < 2300.0:
+        return 64.0 / Re
+
+    # Petukhov (explicit form) for smooth tubes; commonly used with Gnielinski:
+    # f = [0.79*ln(Re) - 1.64]^-2  (valid roughly for 3e3 < Re < 5e6)
+    t = 0.79 * math.log(Re) - 1.64
+    return 1.0 / (t * t)
+
+
+@njit(cache=True, inline="always")
+def _nusselt_gnielinski_fast(Re: float, Pr: float) -> float:
+    f_over_8 = _friction_factor_fast(Re) * 0.125
+    pr_cbrt = _cbrt(Pr)
+    pr_23 = pr_cbrt * pr_cbrt
+
+    numerator = f_over_8 * (Re - 1000.0) * Pr
+    denom = 1.0 + 12.7 * math.sqrt(f_over_8) * (pr_23 - 1.0)
+
+    return numerator / denom
+
+
+@njit(cache=True, inline="always")
+def _nusselt_gnielinski_4000_fast(Pr: float) -> float:
+    pr_cbrt = _cbrt(Pr)
+    return _GNIELINSKI_4000_NUM * Pr / (1.0 + _GNIELINSKI_4000_DEN * (pr_cbrt * pr_cbrt - 1.0))
+
+
+@njit(cache=True, inline="always")
+def _nusselt_internal_fast(Re: float, Pr: float) -> float:
+    if Re < 2300.0:
+        return nusselt_laminar_fully_developed_const_wall_temp()
+
+    if Re > 4000.0:
+        return _nusselt_gnielinski_fast(Re, Pr)
+
+    # Transitional blend (simple, robust MVP approach)
+    Nu_lam = nusselt_laminar_fully_developed_const_wall_temp()
+    Nu_turb = _nusselt_gnielinski_4000_fast(Pr)
+    w = (Re - 2300.0) / (4000.0 - 2300.0)
+    return (1.0 - w) * Nu_lam + w * Nu_turb
+
+
+# -----------------------------
+# Validated correlations
+# -----------------------------
+
+@njit(cache=True)
 def reynolds_number(rho: float, v: float, D: float, mu: float) -> float:
     """
     Reynolds number Re = rho * v * D / mu.
     """
     if rho <= 0.0 or mu <= 0.0 or D <= 0.0:
         raise ValueError("rho, mu and D must be positive.")
-    return rho * v * D / mu
+    return _reynolds_fast(rho, v, D, mu)
 
 
+@njit(cache=True)
 def prandtl_number(cp: float, mu: float, k: float) -> float:
     """
     Prandtl number Pr = cp * mu / k.
     """
     if cp <= 0.0 or mu <= 0.0 or k <= 0.0:
         raise ValueError("cp, mu and k must be positive.")
-    return cp * mu / k
+    return _prandtl_fast(cp, mu, k)
 
 
+@njit(cache=True)
 def mean_velocity(m_dot: float, rho: float, flow_area: float) -> float:
     """
     Mean velocity v = m_dot / (rho * A).
     """
     if m_dot <= 0.0 or rho <= 0.0 or flow_area <= 0.0:
         raise ValueError("m_dot, rho and flow_area must be positive.")
-    return m_dot / (rho * flow_area)
+    return _mean_velocity_fast(m_dot, rho, flow_area)
 
 
+@njit(cache=True)
 def friction_factor_smooth(Re: float) -> float:
     """
     Darcy friction factor for smooth tubes.
@@ -115,15 +270,10 @@ def friction_factor_smooth(Re: float) -> float:
     """
     if Re <= 0.0:
         raise ValueError("Re must be positive.")
-
-    if Re < 2300.0:
-        return 64.0 / Re
-
-    # Petukhov (explicit form) for smooth tubes; commonly used with Gnielinski:
-    # f = [0.79*ln(Re) - 1.64]^-2  (valid roughly for 3e3 < Re < 5e6)
-    return 1.0 / (0.79 * math.log(Re) - 1.64) ** 2
+    return _friction_factor_fast(Re)
 
 
+@njit(cache=True)
 def nusselt_laminar_fully_developed_const_wall_temp() -> float:
     """
     Fully developed laminar flow in a circular tube, constant wall temperature.
@@ -131,6 +281,7 @@ def nusselt_laminar_fully_developed_const_wall_temp() -> float:
     return 3.66
 
 
+@njit(cache=True)
 def nusselt_gnielinski(Re: float, Pr: float) -> float:
     """
     Gnielinski correlation for turbulent flow in smooth tubes.
@@ -143,15 +294,10 @@ def nusselt_gnielinski(Re: float, Pr: float) -> float:
     """
     if Re <= 0.0 or Pr <= 0.0:
         raise ValueError("Re and Pr must be positive.")
-
-    f = friction_factor_smooth(Re)
-
-    numerator = (f / 8.0) * (Re - 1000.0) * Pr
-    denom = 1.0 + 12.7 * math.sqrt(f / 8.0) * (Pr ** (2.0 / 3.0) - 1.0)
-
-    return numerator / denom
+    return _nusselt_gnielinski_fast(Re, Pr)
 
 
+@njit(cache=True)
 def nusselt_internal(Re: float, Pr: float) -> float:
     """
     Nusselt number for internal flow in a smooth circular tube.
@@ -164,18 +310,66 @@ def nusselt_internal(Re: float, Pr: float) -> float:
     -------
     Nu : float
         Nusselt number [-]
+
+    Raises
+    ------
+    ValueError
+        If Re or Pr is not positive, in every regime. (Up to 0.3.0 the
+        laminar branch returned 3.66 for any Re < 2300, including Re <= 0.)
     """
-    if Re < 2300.0:
-        return nusselt_laminar_fully_developed_const_wall_temp()
+    if Re <= 0.0 or Pr <= 0.0:
+        raise ValueError("Re and Pr must be positive.")
+    return _nusselt_internal_fast(Re, Pr)
 
-    if Re > 4000.0:
-        return nusselt_gnielinski(Re, Pr)
 
-    # Transitional blend (simple, robust MVP approach)
-    Nu_lam = nusselt_laminar_fully_developed_const_wall_temp()
-    Nu_turb = nusselt_gnielinski(4000.0, Pr)
-    w = (Re - 2300.0) / (4000.0 - 2300.0)
-    return (1.0 - w) * Nu_lam + w * Nu_turb
+@njit(cache=True)
+def _heat_transfer_coefficient_kernel(
+    m_dot: float,
+    D: float,
+    flow_area: float,
+    rho: float,
+    mu: float,
+    k: float,
+    cp: float,
+) -> tuple[float, float, float, float]:
+    """Unvalidated body of `heat_transfer_coefficient_internal`."""
+    v = _mean_velocity_fast(m_dot, rho, flow_area)
+    Re = _reynolds_fast(rho, v, D, mu)
+    Pr = _prandtl_fast(cp, mu, k)
+
+    Nu = _nusselt_internal_fast(Re, Pr)
+    h = Nu * k / D
+
+    return v, Re, Pr, h
+
+
+@njit(cache=True)
+def _heat_transfer_coefficient_h_kernel(
+    m_dot: float,
+    D: float,
+    flow_area: float,
+    rho: float,
+    mu: float,
+    k: float,
+    cp: float,
+) -> float:
+    """Unvalidated body of `heat_transfer_coefficient_internal_h_only`."""
+    # Compiled: the unused tuple members are never boxed into Python objects
+    return _heat_transfer_coefficient_kernel(m_dot, D, flow_area, rho, mu, k, cp)[3]
+
+
+def _validate_internal_inputs(
+    m_dot: float,
+    tube_inner_diameter: float,
+    flow_area: float,
+    props: FluidProps,
+) -> None:
+    if tube_inner_diameter <= 0.0 or flow_area <= 0.0:
+        raise ValueError("tube_inner_diameter and flow_area must be positive.")
+    if m_dot <= 0.0:
+        raise ValueError("m_dot must be positive.")
+    if not (props.rho > 0.0 and props.mu > 0.0 and props.k > 0.0 and props.cp > 0.0):
+        raise ValueError("rho, mu, k and cp must be positive.")
 
 
 def heat_transfer_coefficient_internal(
@@ -183,7 +377,7 @@ def heat_transfer_coefficient_internal(
     tube_inner_diameter: float,
     flow_area: float,
     props: FluidProps,
-) -> tuple[float, float, float, float]:
+) -> InternalFlowResult:
     """
     Convenience function returning tube-side h and key dimensionless groups.
 
@@ -200,23 +394,273 @@ def heat_transfer_coefficient_internal(
 
     Returns
     -------
-    v : float
-        Mean velocity [m/s]
-    Re : float
-        Reynolds number [-]
-    Pr : float
-        Prandtl number [-]
-    h : float
-        Internal convective heat transfer coefficient [W/(m^2*K)]
+    InternalFlowResult
+        Named tuple (v, Re, Pr, h):
+        v [m/s], Re [-], Pr [-], h [W/(m^2*K)].
     """
-    if tube_inner_diameter <= 0.0:
-        raise ValueError("tube_inner_diameter must be positive.")
+    _validate_internal_inputs(m_dot, tube_inner_diameter, flow_area, props)
 
-    v = mean_velocity(m_dot, props.rho, flow_area)
-    Re = reynolds_number(props.rho, v, tube_inner_diameter, props.mu)
-    Pr = prandtl_number(props.cp, props.mu, props.k)
+    return InternalFlowResult(*_heat_transfer_coefficient_kernel(
+        m_dot, tube_inner_diameter, flow_area,
+        props.rho, props.mu, props.k, props.cp,
+    ))
 
-    Nu = nusselt_internal(Re, Pr)
-    h = Nu * props.k / tube_inner_diameter
 
-    return v, Re, Pr, h
+def heat_transfer_coefficient_internal_h_only(
+    m_dot: float,
+    tube_inner_diameter: float,
+    flow_area: float,
+    props: FluidProps,
+) -> float:
+    """
+    Tube-side heat transfer coefficient h [W/(m^2*K)] only.
+
+    Same inputs and result as `heat_transfer_coefficient_internal(...).h`,
+    without building the result tuple; intended for iterative callers that
+    need only h.
+    """
+    _validate_internal_inputs(m_dot, tube_inner_diameter, flow_area, props)
+
+    return _heat_transfer_coefficient_h_kernel(
+        m_dot, tube_inner_diameter, flow_area,
+        props.rho, props.mu, props.k, props.cp,
+    )
+
+
+@njit(cache=True)
+def _thermo_hydraulic_kernel(
+    m_dot: float,
+    D: float,
+    flow_area: float,
+    L: float,
+    rho: float,
+    mu: float,
+    k: float,
+    cp: float,
+) -> tuple[float, float, float, float, float, float, float]:
+    """Unvalidated body of `thermo_hydraulic_internal`."""
+    v = _mean_velocity_fast(m_dot, rho, flow_area)
+    Re = _reynolds_fast(rho, v, D, mu)
+    Pr = _prandtl_fast(cp, mu, k)
+    f = _friction_factor_fast(Re)
+
+    if Re > 4000.0:
+        # Gnielinski with the friction factor shared with Darcy–Weisbach
+        f_over_8 = f * 0.125
+        pr_cbrt = _cbrt(Pr)
+        pr_23 = pr_cbrt * pr_cbrt
+        Nu = f_over_8 * (Re - 1000.0) * Pr / (1.0 + 12.7 * math.sqrt(f_over_8) * (pr_23 - 1.0))
+    else:
+        Nu = _nusselt_internal_fast(Re, Pr)
+
+    h = Nu * k / D
+    dp_friction = f * (L / D) * (0.5 * rho * v * v)
+
+    return v, Re, Pr, f, Nu, h, dp_friction
+
+
+def thermo_hydraulic_internal(
+    m_dot: float,
+    tube_inner_diameter: float,
+    flow_area: float,
+    flow_length: float,
+    props: FluidProps,
+) -> ThermoHydraulicResult:
+    """
+    Tube-side heat transfer coefficient and frictional pressure drop in one pass.
+
+    Equivalent to `heat_transfer_coefficient_internal` combined with the
+    Darcy–Weisbach term of `internal_pressure_drop.pressure_drop_tubes`, but
+    velocity, Re, Pr and the friction factor are evaluated only once and
+    shared between the Gnielinski and Darcy–Weisbach relations.
+
+    Parameters
+    ----------
+    m_dot : float
+        Mass flow rate [kg/s].
+    tube_inner_diameter : float
+        Inner diameter D_i [m].
+    flow_area : float
+        Flow cross-sectional area [m^2].
+    flow_length : float
+        Hydraulic flow length for friction losses [m].
+    props : FluidProps
+        Thermophysical properties at representative conditions.
+
+    Returns
+    -------
+    ThermoHydraulicResult
+        Named tuple (v, Re, Pr, f, Nu, h, dp_friction):
+        v [m/s], Re [-], Pr [-], Darcy f [-], Nu [-], h [W/(m^2*K)],
+        frictional pressure drop along flow_length [Pa].
+    """
+    if tube_inner_diameter <= 0.0 or flow_area <= 0.0 or flow_length <= 0.0:
+        raise ValueError("tube_inner_diameter, flow_area and flow_length must be positive.")
+    if m_dot <= 0.0:
+        raise ValueError("m_dot must be positive.")
+    if not (props.rho > 0.0 and props.mu > 0.0 and props.k > 0.0 and props.cp > 0.0):
+        raise ValueError("rho, mu, k and cp must be positive.")
+
+    return ThermoHydraulicResult(*_thermo_hydraulic_kernel(
+        m_dot, tube_inner_diameter, flow_area, flow_length,
+        props.rho, props.mu, props.k, props.cp,
+    ))
+
+
+def _prewarm() -> None:
+    """
+    Trigger compilation (or on-disk cache load) of the jitted scalar kernels
+    for float arguments, so the cost is paid at import rather than inside
+    the first solver loop.
+    """
+    reynolds_number(1000.0, 1.0, 0.01, 1e-3)
+    prandtl_number(4180.0, 1e-3, 0.6)
+    mean_velocity(1.0, 1000.0, 1e-3)
+    friction_factor_smooth(1e4)
+    nusselt_gnielinski(1e4, 5.0)
+    nusselt_internal(1e4, 5.0)
+    _heat_transfer_coefficient_kernel(1.0, 0.01, 1e-4, 1000.0, 1e-3, 0.6, 4180.0)
+    _thermo_hydraulic_kernel(1.0, 0.01, 1e-4, 1.0, 1000.0, 1e-3, 0.6, 4180.0)
+
+
+if HAVE_NUMBA:
+    _prewarm()
+
+
+# -----------------------------
+# Vectorized correlations (sweeps)
+# -----------------------------
+# The *_vec functions accept scalars or NumPy arrays and broadcast their
+# arguments. With Numba, friction factor and Nusselt number are compiled
+# ufuncs built from the scalar kernels (branching per element, no
+# temporaries). Without Numba, the friction factor evaluates both branches
+# and merges them with np.where; the Nusselt number evaluates each regime on
+# its own boolean mask. Both are much cheaper than per-element Python
+# branching. Results are identical to the scalar
+# functions above. Each public *_vec function validates every input array
+# once and delegates to an unchecked `_*_vec_fast` twin.
+
+if HAVE_NUMBA:
+    @vectorize(["float64(float64)"], cache=True)
+    def _friction_factor_ufunc(Re):
+        return _friction_factor_fast(Re)
+
+    @vectorize(["float64(float64, float64)"], cache=True)
+    def _nusselt_internal_ufunc(Re, Pr):
+        return _nusselt_internal_fast(Re, Pr)
+
+def _friction_factor_vec_fast(Re: np.ndarray) -> np.ndarray:
+    # Unchecked body of `friction_factor_smooth_vec`
+    if HAVE_NUMBA:
+        return _friction_factor_ufunc(Re)
+
+    f_lam = 64.0 / Re
+
+    # Petukhov: f = [0.79*ln(Re) - 1.64]^-2
+    t = np.log(Re)
+    t *= 0.79
+    t -= 1.64
+    f_turb = 1.0 / (t * t)
+
+    return np.where(Re < 2300.0, f_lam, f_turb)
+
+
+def _nusselt_gnielinski_vec_fast(Re: np.ndarray, Pr: np.ndarray) -> np.ndarray:
+    # Unchecked body of `nusselt_gnielinski_vec`
+    f_over_8 = _friction_factor_vec_fast(Re) * 0.125
+
+    numerator = f_over_8 * (Re - 1000.0) * Pr
+
+    # Pr^(2/3) = cbrt(Pr)^2
+    denom = np.cbrt(Pr)
+    denom *= denom
+    denom -= 1.0
+    denom *= 12.7 * np.sqrt(f_over_8)
+    denom += 1.0
+
+    return numerator / denom
+
+
+def _nusselt_internal_vec_fast(Re: np.ndarray, Pr: np.ndarray) -> np.ndarray:
+    # Unchecked body of `nusselt_internal_vec`; Re and Pr already broadcast
+    if HAVE_NUMBA:
+        return _nusselt_internal_ufunc(Re, Pr)
+
+    # Each regime is evaluated on its own elements only: Gnielinski at
+    # laminar Re is wasted work and can divide by zero for Pr < 1.
+    Re, Pr = np.broadcast_arrays(Re, Pr)
+    Nu_lam = nusselt_laminar_fully_developed_const_wall_temp()
+    Nu = np.full(Re.shape, Nu_lam)
+
+    turb = Re > 4000.0
+    if np.any(turb):
+        Nu[turb] = _nusselt_gnielinski_vec_fast(Re[turb], Pr[turb])
+
+    # Transitional blend
+    trans = (Re >= 2300.0) & ~turb
+    if np.any(trans):
+        Re_t = Re[trans]
+        Pr_t = Pr[trans]
+        pr_23 = np.cbrt(Pr_t)
+        pr_23 *= pr_23
+        Nu_turb_4000 = _GNIELINSKI_4000_NUM * Pr_t / (1.0 + _GNIELINSKI_4000_DEN * (pr_23 - 1.0))
+        w = (Re_t - 2300.0) / (4000.0 - 2300.0)
+        Nu[trans] = (1.0 - w) * Nu_lam + w * Nu_turb_4000
+
+    return Nu
+
+
+def friction_factor_smooth_vec(Re: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Darcy friction factor for smooth tubes.
+
+    See `friction_factor_smooth` for the correlations used.
+
+    Returns
+    -------
+    f : np.ndarray
+        Darcy friction factor [-]
+    """
+    Re = np.asarray(Re, dtype=float)
+    if not np.all(Re > 0.0):
+        raise ValueError("Re must be positive.")
+    return _friction_factor_vec_fast(Re)
+
+
+def nusselt_gnielinski_vec(Re: np.ndarray, Pr: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Gnielinski correlation for turbulent flow in smooth tubes.
+
+    See `nusselt_gnielinski` for the formula and validity range.
+    """
+    Re = np.asarray(Re, dtype=float)
+    Pr = np.asarray(Pr, dtype=float)
+    if not (np.all(Re > 0.0) and np.all(Pr > 0.0)):
+        raise ValueError("Re and Pr must be positive.")
+    return _nusselt_gnielinski_vec_fast(Re, Pr)
+
+
+def nusselt_internal_vec(Re: np.ndarray, Pr: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Nusselt number for internal flow in a smooth circular tube.
+
+    Same regimes as `nusselt_internal`:
+    - Laminar (Re < 2300): Nu = 3.66
+    - Turbulent (Re > 4000): Gnielinski
+    - Transitional: linear blend between Re=2300 and Re=4000
+
+    Returns
+    -------
+    Nu : np.ndarray
+        Nusselt number [-], broadcast shape of Re and Pr.
+
+    Raises
+    ------
+    ValueError
+        If any Re or Pr is not positive (as `nusselt_internal`).
+    """
+    Re = np.asarray(Re, dtype=float)
+    Pr = np.asarray(Pr, dtype=float)
+    if not (np.all(Re > 0.0) and np.all(Pr > 0.0)):
+        raise ValueError("Re and Pr must be positive.")
+    return _nusselt_internal_vec_fast(*np.broadcast_arrays(Re, Pr))
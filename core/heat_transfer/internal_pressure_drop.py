@@ -30,6 +30,9 @@ Total pressure drop is decomposed into components:
     dp_total = dp_tubes + dp_inlet + dp_outlet + dp_turns
 
 Each component is computed by a dedicated function to allow refinement later.
+`pressure_drop_internal_total` evaluates the same terms in a single fused pass
+(dynamic pressure computed once); `pressure_drop_internal_total_vec` does so
+over NumPy arrays of operating points.
 
 Literature references
 ---------------------
@@ -46,20 +49,56 @@ Notes
 - Single-phase flow, smooth tubes.
 - Turn losses are modeled via a lumped K_turn per 180° return (U-bend/return header).
   This is a practical MVP placeholder that can be replaced with geometry-specific models.
+- Public functions validate their inputs and delegate to unchecked private
+  kernels (`_*_fast`); both are compiled with Numba when it is installed,
+  as in `internal_flow` and `outside_flow`.
 """
 
 from __future__ import annotations
 
-import math
-from dataclasses import dataclass
+from typing import NamedTuple
 
+import numpy as np
 
-@dataclass(frozen=True)
-class FluidProps:
-    rho: float  # [kg/m^3]
-    mu: float   # [Pa*s]
+from core._jit import njit
+from core.heat_transfer.fluid_props import FluidProps
+from core.heat_transfer.internal_flow import (
+    _friction_factor_fast,
+    _friction_factor_vec_fast,
+    _mean_velocity_fast,
+    _reynolds_fast,
+)
 
 
+class InternalPressureDropResult(NamedTuple):
+    """Result of `pressure_drop_internal_total` (unpacks as an 8-tuple)."""
+    dp_total: float   # [Pa]
+    dp_tubes: float   # [Pa]
+    dp_inlet: float   # [Pa]
+    dp_outlet: float  # [Pa]
+    dp_turns: float   # [Pa]
+    Re: float         # [-]
+    f: float          # [-] Darcy friction factor
+    v: float          # [m/s]
+
+
+# -----------------------------
+# Unchecked kernels
+# -----------------------------
+# No input validation: callers must guarantee positive inputs. Velocity,
+# Re and the friction factor are the `internal_flow` kernels, so the
+# thermal and hydraulic sides share one implementation.
+
+@njit(cache=True, inline="always")
+def _dynamic_pressure_fast(rho: float, v: float) -> float:
+    return 0.5 * rho * v * v
+
+
+# -----------------------------
+# Validated primitives
+# -----------------------------
+
+@njit(cache=True)
 def mean_velocity(m_dot: float, rho: float, flow_area: float) -> float:
     """v = m_dot / (rho * A)"""
     if m_dot <= 0.0:
@@ -68,16 +107,18 @@ def mean_velocity(m_dot: float, rho: float, flow_area: float) -> float:
         raise ValueError("rho must be positive.")
     if flow_area <= 0.0:
         raise ValueError("flow_area must be positive.")
-    return m_dot / (rho * flow_area)
+    return _mean_velocity_fast(m_dot, rho, flow_area)
 
 
+@njit(cache=True)
 def reynolds_number(rho: float, v: float, D: float, mu: float) -> float:
     """Re = rho * v * D / mu"""
     if rho <= 0.0 or mu <= 0.0 or D <= 0.0 or v <= 0.0:
         raise ValueError("rho, mu, D, v must be positive.")
-    return rho * v * D / mu
+    return _reynolds_fast(rho, v, D, mu)
 
 
+@njit(cache=True)
 def friction_factor_smooth(Re: float) -> float:
     """
     Darcy friction factor for smooth tubes.
@@ -89,22 +130,22 @@ def friction_factor_smooth(Re: float) -> float:
     """
     if Re <= 0.0:
         raise ValueError("Re must be positive.")
-    if Re < 2300.0:
-        return 64.0 / Re
-    return 1.0 / (0.79 * math.log(Re) - 1.64) ** 2
+    return _friction_factor_fast(Re)
 
 
+@njit(cache=True)
 def dynamic_pressure(rho: float, v: float) -> float:
     """q = rho*v^2/2"""
     if rho <= 0.0 or v <= 0.0:
         raise ValueError("rho and v must be positive.")
-    return rho * v * v / 2.0
+    return _dynamic_pressure_fast(rho, v)
 
 
 # -----------------------------
 # Component pressure drop terms
 # -----------------------------
 
+@njit(cache=True)
 def pressure_drop_tubes(f: float, L: float, D: float, rho: float, v: float) -> float:
     """
     Frictional losses along tube length (Darcy–Weisbach).
@@ -117,9 +158,12 @@ def pressure_drop_tubes(f: float, L: float, D: float, rho: float, v: float) -> f
         raise ValueError("f must be positive.")
     if L <= 0.0 or D <= 0.0:
         raise ValueError("L and D must be positive.")
-    return f * (L / D) * dynamic_pressure(rho, v)
+    if rho <= 0.0 or v <= 0.0:
+        raise ValueError("rho and v must be positive.")
+    return f * (L / D) * _dynamic_pressure_fast(rho, v)
 
 
+@njit(cache=True)
 def pressure_drop_inlet(rho: float, v: float, K_in: float = 0.5) -> float:
     """
     Inlet minor loss.
@@ -131,9 +175,12 @@ def pressure_drop_inlet(rho: float, v: float, K_in: float = 0.5) -> float:
     """
     if K_in < 0.0:
         raise ValueError("K_in must be non-negative.")
-    return K_in * dynamic_pressure(rho, v)
+    if rho <= 0.0 or v <= 0.0:
+        raise ValueError("rho and v must be positive.")
+    return K_in * _dynamic_pressure_fast(rho, v)
 
 
+@njit(cache=True)
 def pressure_drop_outlet(rho: float, v: float, K_out: float = 1.0) -> float:
     """
     Outlet minor loss.
@@ -145,9 +192,12 @@ def pressure_drop_outlet(rho: float, v: float, K_out: float = 1.0) -> float:
     """
     if K_out < 0.0:
         raise ValueError("K_out must be non-negative.")
-    return K_out * dynamic_pressure(rho, v)
+    if rho <= 0.0 or v <= 0.0:
+        raise ValueError("rho and v must be positive.")
+    return K_out * _dynamic_pressure_fast(rho, v)
 
 
+@njit(cache=True)
 def pressure_drop_turns(rho: float, v: float, n_turns: int, K_turn: float = 1.5) -> float:
     """
     Return/turn losses (e.g. 180° turns between passes).
@@ -162,7 +212,83 @@ def pressure_drop_turns(rho: float, v: float, n_turns: int, K_turn: float = 1.5)
         raise ValueError("n_turns must be non-negative.")
     if K_turn < 0.0:
         raise ValueError("K_turn must be non-negative.")
-    return float(n_turns) * K_turn * dynamic_pressure(rho, v)
+    if rho <= 0.0 or v <= 0.0:
+        raise ValueError("rho and v must be positive.")
+    return float(n_turns) * K_turn * _dynamic_pressure_fast(rho, v)
+
+
+@njit(cache=True)
+def _pressure_drop_internal_kernel(
+    m_dot: float,
+    flow_area: float,
+    D: float,
+    L: float,
+    rho: float,
+    mu: float,
+    n_turns: float,
+    K_in: float,
+    K_out: float,
+    K_turn: float,
+) -> tuple[float, float, float, float, float, float, float, float]:
+    """Unvalidated body of `pressure_drop_internal_total`."""
+    v = _mean_velocity_fast(m_dot, rho, flow_area)
+    Re = _reynolds_fast(rho, v, D, mu)
+    f = _friction_factor_fast(Re)
+
+    # Dynamic pressure, shared by all components
+    q = _dynamic_pressure_fast(rho, v)
+
+    dp_t = f * (L / D) * q   # Darcy–Weisbach
+    dp_in = K_in * q
+    dp_out = K_out * q
+    dp_turn = n_turns * K_turn * q
+
+    dp_total = dp_t + dp_in + dp_out + dp_turn
+
+    return dp_total, dp_t, dp_in, dp_out, dp_turn, Re, f, v
+
+
+@njit(cache=True)
+def _pressure_drop_internal_dp_kernel(
+    m_dot: float,
+    flow_area: float,
+    D: float,
+    L: float,
+    rho: float,
+    mu: float,
+    n_turns: float,
+    K_in: float,
+    K_out: float,
+    K_turn: float,
+) -> float:
+    """Unvalidated body of `pressure_drop_internal_total_dp_only`."""
+    # Compiled: the unused tuple members are never boxed into Python objects
+    return _pressure_drop_internal_kernel(
+        m_dot, flow_area, D, L, rho, mu, n_turns, K_in, K_out, K_turn,
+    )[0]
+
+
+def _validate_pressure_drop_inputs(
+    m_dot: float,
+    flow_area: float,
+    hydraulic_diameter: float,
+    flow_length: float,
+    props: FluidProps,
+    n_turns: int,
+    K_in: float,
+    K_out: float,
+    K_turn: float,
+) -> None:
+    if flow_area <= 0.0 or hydraulic_diameter <= 0.0 or flow_length <= 0.0:
+        raise ValueError("flow_area, hydraulic_diameter, flow_length must be positive.")
+    if m_dot <= 0.0:
+        raise ValueError("m_dot must be positive.")
+    if props.rho <= 0.0 or props.mu <= 0.0:
+        raise ValueError("rho and mu must be positive.")
+    if n_turns < 0:
+        raise ValueError("n_turns must be non-negative.")
+    if K_in < 0.0 or K_out < 0.0 or K_turn < 0.0:
+        raise ValueError("K_in, K_out and K_turn must be non-negative.")
 
 
 def pressure_drop_internal_total(
@@ -176,38 +302,136 @@ def pressure_drop_internal_total(
     K_in: float = 0.5,
     K_out: float = 1.0,
     K_turn: float = 1.5,
-) -> tuple[float, float, float, float, float, float]:
+) -> InternalPressureDropResult:
     """
     Compute component-based tube-side pressure drop.
 
     Returns
     -------
-    dp_total : float
-    dp_tubes : float
-    dp_inlet : float
-    dp_outlet : float
-    dp_turns : float
-    Re : float
-
-    Also computes f internally (returned separately below).
+    InternalPressureDropResult
+        Named tuple (dp_total, dp_tubes, dp_inlet, dp_outlet, dp_turns, Re, f, v):
+        pressure drops [Pa], Re [-], Darcy friction factor f [-],
+        mean velocity v [m/s].
 
     Notes
     -----
     - Defaults for K coefficients are allowed for MVP only.
     - Callers may override them explicitly for engineering calibration.
+    - The component terms are those of `pressure_drop_tubes`, `pressure_drop_inlet`,
+      `pressure_drop_outlet` and `pressure_drop_turns`, evaluated inline with the
+      dynamic pressure q = rho*v^2/2 computed once.
     """
-    if flow_area <= 0.0 or hydraulic_diameter <= 0.0 or flow_length <= 0.0:
-        raise ValueError("flow_area, hydraulic_diameter, flow_length must be positive.")
+    _validate_pressure_drop_inputs(
+        m_dot, flow_area, hydraulic_diameter, flow_length, props,
+        n_turns, K_in, K_out, K_turn,
+    )
 
-    v = mean_velocity(m_dot, props.rho, flow_area)
-    Re = reynolds_number(props.rho, v, hydraulic_diameter, props.mu)
-    f = friction_factor_smooth(Re)
+    return InternalPressureDropResult(*_pressure_drop_internal_kernel(
+        m_dot, flow_area, hydraulic_diameter, flow_length, props.rho, props.mu,
+        float(n_turns), K_in, K_out, K_turn,
+    ))
 
-    dp_t = pressure_drop_tubes(f, flow_length, hydraulic_diameter, props.rho, v)
-    dp_in = pressure_drop_inlet(props.rho, v, K_in=K_in)
-    dp_out = pressure_drop_outlet(props.rho, v, K_out=K_out)
-    dp_turn = pressure_drop_turns(props.rho, v, n_turns=n_turns, K_turn=K_turn)
+
+def pressure_drop_internal_total_dp_only(
+    m_dot: float,
+    flow_area: float,
+    hydraulic_diameter: float,
+    flow_length: float,
+    props: FluidProps,
+    *,
+    n_turns: int = 0,
+    K_in: float = 0.5,
+    K_out: float = 1.0,
+    K_turn: float = 1.5,
+) -> float:
+    """
+    Total tube-side pressure drop dp_total [Pa] only.
+
+    Same inputs and result as `pressure_drop_internal_total(...).dp_total`,
+    without building the result tuple.
+    """
+    _validate_pressure_drop_inputs(
+        m_dot, flow_area, hydraulic_diameter, flow_length, props,
+        n_turns, K_in, K_out, K_turn,
+    )
+
+    return _pressure_drop_internal_dp_kernel(
+        m_dot, flow_area, hydraulic_diameter, flow_length, props.rho, props.mu,
+        float(n_turns), K_in, K_out, K_turn,
+    )
+
+
+def _pressure_drop_internal_vec_kernel(
+    m_dot: np.ndarray,
+    flow_area: float,
+    hydraulic_diameter: float,
+    flow_length: float,
+    rho: np.ndarray,
+    mu: np.ndarray,
+    n_turns: int,
+    K_in: float,
+    K_out: float,
+    K_turn: float,
+) -> tuple[np.ndarray, ...]:
+    """Unvalidated body of `pressure_drop_internal_total_vec`."""
+    v = m_dot / (rho * flow_area)
+    Re = rho * v * hydraulic_diameter / mu
+
+    f = _friction_factor_vec_fast(Re)
+
+    q = 0.5 * rho * v * v
+
+    dp_t = f * (flow_length / hydraulic_diameter) * q
+    dp_in = K_in * q
+    dp_out = K_out * q
+    dp_turn = (float(n_turns) * K_turn) * q
 
     dp_total = dp_t + dp_in + dp_out + dp_turn
 
     return dp_total, dp_t, dp_in, dp_out, dp_turn, Re, f, v
+
+
+def pressure_drop_internal_total_vec(
+    m_dot: np.ndarray,
+    flow_area: float,
+    hydraulic_diameter: float,
+    flow_length: float,
+    rho: np.ndarray,
+    mu: np.ndarray,
+    *,
+    n_turns: int = 0,
+    K_in: float = 0.5,
+    K_out: float = 1.0,
+    K_turn: float = 1.5,
+) -> tuple[np.ndarray, ...]:
+    """
+    Vectorized `pressure_drop_internal_total` over arrays of operating points.
+
+    `m_dot`, `rho` and `mu` may be scalars or NumPy arrays; they are
+    broadcast against each other. Geometry and loss coefficients are scalars.
+
+    Returns
+    -------
+    (dp_total, dp_tubes, dp_inlet, dp_outlet, dp_turns, Re, f, v)
+        Tuple of arrays with the broadcast shape of the inputs, in the same
+        order as `pressure_drop_internal_total`.
+    """
+    if flow_area <= 0.0 or hydraulic_diameter <= 0.0 or flow_length <= 0.0:
+        raise ValueError("flow_area, hydraulic_diameter, flow_length must be positive.")
+    if n_turns < 0:
+        raise ValueError("n_turns must be non-negative.")
+    if K_in < 0.0 or K_out < 0.0 or K_turn < 0.0:
+        raise ValueError("K_in, K_out and K_turn must be non-negative.")
+
+    m_dot = np.asarray(m_dot, dtype=float)
+    rho = np.asarray(rho, dtype=float)
+    mu = np.asarray(mu, dtype=float)
+    if not np.all(m_dot > 0.0):
+        raise ValueError("m_dot must be positive.")
+    if not (np.all(rho > 0.0) and np.all(mu > 0.0)):
+        raise ValueError("rho and mu must be positive.")
+
+    return _pressure_drop_internal_vec_kernel(
+        m_dot, flow_area, hydraulic_diameter, flow_length, rho, mu,
+        n_turns, K_in, K_out, K_turn,
+    )
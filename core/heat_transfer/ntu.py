@@ -41,7 +41,50 @@ This follows directly from energy balance.
 from __future__ import annotations
 
 import math
-from core.heat_transfer.streams import EnergyStream
+
+import numpy as np
+
+from core._jit import njit
+from core.heat_transfer.streams import EnergyStream, StreamKind
+from core.types import FlowArrangement
+
+
+# Counterflow
+# Ref: Incropera (standard ε–NTU counterflow relation)
+#   eps = (1 - e) / (1 - C_r*e),  e = exp(-NTU*(1 - C_r))
+# Written with em = expm1(-x) = e - 1, x = NTU*(1 - C_r):
+#   eps = -em / ((1 - C_r) - C_r*em)
+# Numerator and denominator both scale with (1 - C_r), so the form stays
+# well-conditioned as C_r -> 1 and tends to the balanced limit NTU/(1 + NTU).
+# Only C_r == 1 exactly (0/0) needs the limit explicitly.
+def _eps_counterflow(NTU: float, C_r: float) -> float:
+    one_minus_C_r = 1.0 - C_r
+    if one_minus_C_r == 0.0:
+        return NTU / (1.0 + NTU)
+    em = math.expm1(-NTU * one_minus_C_r)
+    return -em / (one_minus_C_r - C_r * em)
+
+
+# Cocurrentflow (parallel)
+# Ref: Incropera (standard ε–NTU parallel relation)
+def _eps_cocurrentflow(NTU: float, C_r: float) -> float:
+    return (1.0 - math.exp(-NTU * (1.0 + C_r))) / (1.0 + C_r)
+
+
+# Compiled twins for the njit kernels (`_solve_core`, `_sweep_designs_kernel`).
+# `effectiveness_ntu` calls the plain functions: for a few flops, a Numba
+# dispatcher call from Python costs more than it saves.
+_eps_counterflow_kernel = njit(cache=True)(_eps_counterflow)
+_eps_cocurrentflow_kernel = njit(cache=True)(_eps_cocurrentflow)
+
+
+_EPS_HANDLERS = {
+    FlowArrangement.COUNTERFLOW: _eps_counterflow,
+    FlowArrangement.COCURRENTFLOW: _eps_cocurrentflow,
+    # Crossflow (both fluids mixed, MVP)
+    # Ref concept: lumped mixing removes counterflow advantage; use cocurrent-like form in 0D.
+    FlowArrangement.CROSSFLOW: _eps_cocurrentflow,
+}
 
 
 def effectiveness_ntu(
@@ -49,16 +92,18 @@ def effectiveness_ntu(
     C_cold: float,
     UA: float,
     *,
-    flow_arrangement: str = "counterflow",
+    flow_arrangement: str | FlowArrangement = "counterflow",
 ) -> float:
     """
     Compute effectiveness ε using ε–NTU.
 
-    Supported flow arrangements (MVP):
+    Supported flow arrangements (MVP), as string or `FlowArrangement` tag:
     - "counterflow"
     - "cocurrentflow"
     - "crossflow"  (default assumption: both fluids mixed)
 
+    Passing a `FlowArrangement` avoids string parsing on every call.
+
     Crossflow remark (MVP)
     ----------------------
     With both fluids treated as perfectly mixed (lumped-parameter),
@@ -80,32 +125,85 @@ def effectiveness_ntu(
 
     NTU = UA / C_min
 
-    fa = flow_arrangement.lower()
+    fa = FlowArrangement.parse(flow_arrangement)
 
-    # Counterflow
-    # Ref: Incropera (standard ε–NTU counterflow relation)
-    if fa == "counterflow":
-        if abs(1.0 - C_r) < 1e-9:
-            eps = NTU / (1.0 + NTU)
-        else:
-            eps = (1.0 - math.exp(-NTU * (1.0 - C_r))) / (1.0 - C_r * math.exp(-NTU * (1.0 - C_r)))
+    return _EPS_HANDLERS[fa](NTU, C_r)
 
-    # Cocurrentflow (parallel)
-    # Ref: Incropera (standard ε–NTU parallel relation)
-    elif fa == "cocurrentflow":
-        eps = (1.0 - math.exp(-NTU * (1.0 + C_r))) / (1.0 + C_r)
 
-    # Crossflow (both fluids mixed, MVP)
-    # Ref concept: lumped mixing removes counterflow advantage; use cocurrent-like form in 0D.
-    elif fa == "crossflow":
-        eps = (1.0 - math.exp(-NTU * (1.0 + C_r))) / (1.0 + C_r)
+def effectiveness_ntu_vec(
+    C_hot: np.ndarray,
+    C_cold: np.ndarray,
+    UA: np.ndarray,
+    *,
+    flow_arrangement: str | FlowArrangement = "counterflow",
+) -> np.ndarray:
+    """
+    Vectorized `effectiveness_ntu` for design sweeps.
+
+    `C_hot`, `C_cold` and `UA` may be scalars or NumPy arrays and are broadcast
+    against each other. The flow arrangement is resolved once; the relations
+    are identical to the scalar function.
+
+    Returns
+    -------
+    eps : np.ndarray
+        Effectiveness [-], broadcast shape of the inputs.
+    """
+    C_hot = np.asarray(C_hot, dtype=float)
+    C_cold = np.asarray(C_cold, dtype=float)
+    UA = np.asarray(UA, dtype=float)
+
+    # `not all(x > 0)` also rejects NaN
+    if not (np.all(C_hot > 0.0) and np.all(C_cold > 0.0)):
+        raise ValueError("C_hot and C_cold must be positive.")
+    if not np.all(UA > 0.0):
+        raise ValueError("UA must be positive.")
+
+    fa = FlowArrangement.parse(flow_arrangement)
+
+    C_min = np.minimum(C_hot, C_cold)
+    C_max = np.maximum(C_hot, C_cold)
+    C_r = C_min / C_max
+
+    NTU = UA / C_min
+
+    if fa == FlowArrangement.COUNTERFLOW:
+        # expm1 form (see _eps_counterflow); the denominator is replaced where
+        # C_r == 1 exactly so the discarded elements do not produce 0/0.
+        one_minus_C_r = 1.0 - C_r
+        balanced = one_minus_C_r == 0.0
+        em = np.expm1(-NTU * one_minus_C_r)
+        denom = np.where(balanced, 1.0, one_minus_C_r - C_r * em)
+        eps = np.where(balanced, NTU / (1.0 + NTU), -em / denom)
 
     else:
-        raise ValueError(f"Unsupported flow_arrangement: {flow_arrangement}")
+        # Cocurrentflow and crossflow (both fluids mixed, MVP) share one form
+        eps = (1.0 - np.exp(-NTU * (1.0 + C_r))) / (1.0 + C_r)
 
     return eps
 
 
+def effectiveness_ntu_isothermal(C: float, UA: float) -> float:
+    """
+    Effectiveness when the other stream is isothermal (C_r = 0).
+
+    With C_r = 0 every flow arrangement reduces to
+
+        eps = 1 - exp(-NTU),  NTU = UA / C
+
+    where C [W/K] is the capacity rate of the sensible stream (= C_min).
+    Evaluated as -expm1(-NTU), accurate also for small NTU.
+
+    Ref: Incropera et al., ε–NTU relations for C_r = 0.
+    """
+    if C <= 0.0:
+        raise ValueError("C must be positive.")
+    if UA <= 0.0:
+        raise ValueError("UA must be positive.")
+
+    return -math.expm1(-UA / C)
+
+
 def heat_duty_from_effectiveness(
     eps: float,
     hot_stream: EnergyStream,
@@ -114,20 +212,93 @@ def heat_duty_from_effectiveness(
     """
     Compute heat duty and outlet temperatures from ε.
 
+    An isothermal stream (`is_isothermal`) keeps its inlet temperature and
+    the other stream's capacity rate is C_min; its infinite
+    `capacity_rate()` is not used.
+
+    Outlet temperatures assume constant capacity rates. Do not pass a
+    `MoistAirStream` directly: its outlet temperature follows from the
+    outlet enthalpy through psychrometrics, which the segmented solver owns.
+
     Ref: Incropera, ε–NTU method (Q = ε * Q_max).
     """
     if not (0.0 <= eps <= 1.0):
         raise ValueError("eps must be between 0 and 1.")
 
+    hot_iso = hot_stream.is_isothermal
+    cold_iso = cold_stream.is_isothermal
+    if hot_iso and cold_iso:
+        raise ValueError("At most one stream can be isothermal.")
+
+    T_hot_in = hot_stream.inlet_temperature()
+    T_cold_in = cold_stream.inlet_temperature()
+
+    if hot_iso:
+        C_cold = cold_stream.capacity_rate()
+        Q = eps * (C_cold * (T_hot_in - T_cold_in))
+        return Q, T_hot_in, T_cold_in + Q / C_cold
+
+    if cold_iso:
+        C_hot = hot_stream.capacity_rate()
+        Q = eps * (C_hot * (T_hot_in - T_cold_in))
+        return Q, T_hot_in - Q / C_hot, T_cold_in
+
     C_hot = hot_stream.capacity_rate()
     C_cold = cold_stream.capacity_rate()
 
     C_min = min(C_hot, C_cold)
 
-    Q_max = C_min * (hot_stream.inlet_temperature() - cold_stream.inlet_temperature())
+    Q_max = C_min * (T_hot_in - T_cold_in)
     Q = eps * Q_max
 
-    T_hot_out = hot_stream.inlet_temperature() - Q / C_hot
-    T_cold_out = cold_stream.inlet_temperature() + Q / C_cold
+    T_hot_out = T_hot_in - Q / C_hot
+    T_cold_out = T_cold_in + Q / C_cold
+
+    return Q, T_hot_out, T_cold_out
+
+
+def heat_duty_from_effectiveness_vec(
+    eps: np.ndarray,
+    C_hot: np.ndarray,
+    T_hot_in: np.ndarray,
+    C_cold: np.ndarray,
+    T_cold_in: np.ndarray,
+    *,
+    hot_kind: StreamKind | np.ndarray = StreamKind.SENSIBLE,
+    cold_kind: StreamKind | np.ndarray = StreamKind.SENSIBLE,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized `heat_duty_from_effectiveness` on numeric stream data.
+
+    Streams are given in `StreamSpec` form as arrays: heat capacity rate C
+    [W/K], inlet temperature [K] and `StreamKind` tag (scalar or array).
+    CONDENSING (isothermal) streams keep their inlet (saturation)
+    temperature and C_min is the other stream's C; all other kinds follow
+    T_out = T_in ∓ Q / C. All arguments broadcast.
+
+    Returns
+    -------
+    (Q, T_hot_out, T_cold_out) : tuple of np.ndarray
+    """
+    eps = np.asarray(eps, dtype=float)
+    if not np.all((eps >= 0.0) & (eps <= 1.0)):
+        raise ValueError("eps must be between 0 and 1.")
+
+    C_hot = np.asarray(C_hot, dtype=float)
+    C_cold = np.asarray(C_cold, dtype=float)
+    T_hot_in = np.asarray(T_hot_in, dtype=float)
+    T_cold_in = np.asarray(T_cold_in, dtype=float)
+
+    hot_iso = np.equal(hot_kind, StreamKind.CONDENSING)
+    cold_iso = np.equal(cold_kind, StreamKind.CONDENSING)
+    if np.any(hot_iso & cold_iso):
+        raise ValueError("At most one stream can be isothermal.")
+
+    # The isothermal side's C is never used, so it may be given as inf or NaN
+    C_min = np.where(hot_iso, C_cold, np.where(cold_iso, C_hot, np.minimum(C_hot, C_cold)))
+    Q = eps * (C_min * (T_hot_in - T_cold_in))
+
+    T_hot_out = np.where(hot_iso, T_hot_in, T_hot_in - Q / C_hot)
+    T_cold_out = np.where(cold_iso, T_cold_in, T_cold_in + Q / C_cold)
 
     return Q, T_hot_out, T_cold_out
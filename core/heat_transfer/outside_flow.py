@@ -10,50 +10,155 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import numpy as np
 
+from core._jit import njit
+from core.heat_transfer.fluid_props import FluidProps
 
-@dataclass(frozen=True)
-class FluidProps:
-    rho: float  # [kg/m^3]
-    mu: float   # [Pa*s]
-    k: float    # [W/(m*K)]
-    cp: float   # [J/(kg*K)]
+# Zukauskas coefficients per Re band: band i covers _RE_EDGES[i-1] <= Re < _RE_EDGES[i]
+# (band 0 below the first edge, band 3 from the last edge up).
+_RE_EDGES = (1e2, 1e3, 2e5)
+_ZUKAUSKAS_C = (0.90, 0.52, 0.27, 0.021)
+_ZUKAUSKAS_M = (0.40, 0.50, 0.63, 0.84)
 
+_RE_EDGES_ARR = np.array(_RE_EDGES)
+_ZUKAUSKAS_CM = np.array([_ZUKAUSKAS_C, _ZUKAUSKAS_M]).T  # shape (4, 2): rows (C, m)
 
+
+# -----------------------------
+# Unchecked kernels
+# -----------------------------
+# No input validation: callers must guarantee positive inputs. The public
+# functions below validate and delegate here.
+
+@njit(cache=True, inline="always")
+def _reynolds_fast(rho: float, v: float, D: float, mu: float) -> float:
+    return rho * v * D / mu
+
+
+@njit(cache=True, inline="always")
+def _prandtl_fast(cp: float, mu: float, k: float) -> float:
+    return cp * mu / k
+
+
+@njit(cache=True, inline="always")
+def _nusselt_zukauskas_fast(Re: float, Pr: float, n_rows: int) -> float:
+    # Band index from comparisons instead of an if/elif ladder
+    band = int(Re >= _RE_EDGES[0]) + int(Re >= _RE_EDGES[1]) + int(Re >= _RE_EDGES[2])
+    C = _ZUKAUSKAS_C[band]
+    m = _ZUKAUSKAS_M[band]
+
+    Nu = C * (Re ** m) * (Pr ** 0.36)
+
+    if n_rows < 20:
+        Nu *= (n_rows / 20.0) ** 0.20
+
+    return Nu
+
+
+# -----------------------------
+# Validated correlations
+# -----------------------------
+
+@njit(cache=True)
 def reynolds_number(rho: float, v: float, D: float, mu: float) -> float:
     if rho <= 0.0 or mu <= 0.0 or D <= 0.0 or v <= 0.0:
         raise ValueError("rho, mu, D, v must be positive.")
-    return rho * v * D / mu
+    return _reynolds_fast(rho, v, D, mu)
 
 
+@njit(cache=True)
 def prandtl_number(cp: float, mu: float, k: float) -> float:
     if cp <= 0.0 or mu <= 0.0 or k <= 0.0:
         raise ValueError("cp, mu, k must be positive.")
-    return cp * mu / k
+    return _prandtl_fast(cp, mu, k)
 
 
+@njit(cache=True)
 def nusselt_zukauskas(Re: float, Pr: float, n_rows: int) -> float:
     if Re <= 0.0 or Pr <= 0.0:
         raise ValueError("Re and Pr must be positive.")
     if n_rows <= 0:
         raise ValueError("n_rows must be positive.")
+    return _nusselt_zukauskas_fast(Re, Pr, n_rows)
 
-    if Re < 1e2:
-        C, m = 0.90, 0.40
-    elif Re < 1e3:
-        C, m = 0.52, 0.50
-    elif Re < 2e5:
-        C, m = 0.27, 0.63
-    else:
-        C, m = 0.021, 0.84
 
-    Nu = C * (Re ** m) * (Pr ** 0.36)
+@njit(cache=True, inline="always")
+def _outside_flow_state_kernel(
+    m_dot: float,
+    frontal_area: float,
+    D: float,
+    rho: float,
+    mu: float,
+    k: float,
+    cp: float,
+) -> tuple[float, float, float]:
+    """Unvalidated body of `outside_flow_velocity_reynolds`."""
+    v = m_dot / (rho * frontal_area)
+    Re = _reynolds_fast(rho, v, D, mu)
+    Pr = _prandtl_fast(cp, mu, k)
+    return v, Re, Pr
 
-    if n_rows < 20:
-        Nu *= (n_rows / 20.0) ** 0.20
 
-    return Nu
+@njit(cache=True, inline="always")
+def _outside_dp_fast(rho: float, v: float, n_rows: int, zeta_dp: float) -> float:
+    return zeta_dp * n_rows * (rho * v * v / 2.0)
+
+
+@njit(cache=True, inline="always")
+def _outside_flow_h_dp_kernel(
+    Re: float,
+    Pr: float,
+    v: float,
+    rho: float,
+    k: float,
+    D: float,
+    n_rows: int,
+    zeta_dp: float,
+) -> tuple[float, float]:
+    """Unvalidated body of `outside_flow_h_dp`."""
+    h_o = _nusselt_zukauskas_fast(Re, Pr, n_rows) * k / D
+    return h_o, _outside_dp_fast(rho, v, n_rows, zeta_dp)
+
+
+@njit(cache=True)
+def _outside_flow_kernel(
+    m_dot: float,
+    frontal_area: float,
+    D: float,
+    n_rows: int,
+    rho: float,
+    mu: float,
+    k: float,
+    cp: float,
+    zeta_dp: float,
+) -> tuple[float, float, float, float, float]:
+    """Unvalidated, fused body of `outside_flow_from_mass_flow`."""
+    v, Re, Pr = _outside_flow_state_kernel(m_dot, frontal_area, D, rho, mu, k, cp)
+    h_o, dp_o = _outside_flow_h_dp_kernel(Re, Pr, v, rho, k, D, n_rows, zeta_dp)
+    return v, Re, Pr, h_o, dp_o
+
+
+def _validate_outside_inputs(
+    m_dot: float,
+    frontal_area: float,
+    tube_outer_diameter: float,
+    n_rows: int,
+    props: FluidProps,
+    zeta_dp: float,
+) -> None:
+    if m_dot <= 0.0:
+        raise ValueError("m_dot must be positive.")
+    if frontal_area <= 0.0:
+        raise ValueError("frontal_area must be positive.")
+    if tube_outer_diameter <= 0.0:
+        raise ValueError("tube_outer_diameter must be positive.")
+    if zeta_dp <= 0.0:
+        raise ValueError("zeta_dp must be positive.")
+    if n_rows <= 0:
+        raise ValueError("n_rows must be positive.")
+    if not (props.rho > 0.0 and props.mu > 0.0 and props.k > 0.0 and props.cp > 0.0):
+        raise ValueError("rho, mu, k and cp must be positive.")
 
 
 def outside_flow_from_mass_flow(
@@ -76,6 +181,38 @@ def outside_flow_from_mass_flow(
     Pr : float
     h_o : float
     dp_o : float
+
+    Notes
+    -----
+    Inputs are validated once; velocity, Re, Pr, Nu, h_o and dp_o are then
+    evaluated in a single fused kernel (the same relations as
+    `reynolds_number`, `prandtl_number` and `nusselt_zukauskas`).
+    `outside_flow_velocity_reynolds` and `outside_flow_h_dp` evaluate the
+    two halves separately.
+    """
+    _validate_outside_inputs(m_dot, frontal_area, tube_outer_diameter, n_rows, props, zeta_dp)
+
+    return _outside_flow_kernel(
+        m_dot, frontal_area, tube_outer_diameter, n_rows,
+        props.rho, props.mu, props.k, props.cp, zeta_dp,
+    )
+
+
+def outside_flow_velocity_reynolds(
+    m_dot: float,
+    frontal_area: float,
+    tube_outer_diameter: float,
+    props: FluidProps,
+) -> tuple[float, float, float]:
+    """
+    Flow state half of `outside_flow_from_mass_flow`.
+
+    Returns
+    -------
+    v : float
+        Approach (characteristic) velocity [m/s]
+    Re : float
+    Pr : float
     """
     if m_dot <= 0.0:
         raise ValueError("m_dot must be positive.")
@@ -83,17 +220,144 @@ def outside_flow_from_mass_flow(
         raise ValueError("frontal_area must be positive.")
     if tube_outer_diameter <= 0.0:
         raise ValueError("tube_outer_diameter must be positive.")
+    if not (props.rho > 0.0 and props.mu > 0.0 and props.k > 0.0 and props.cp > 0.0):
+        raise ValueError("rho, mu, k and cp must be positive.")
+
+    return _outside_flow_state_kernel(
+        m_dot, frontal_area, tube_outer_diameter, props.rho, props.mu, props.k, props.cp,
+    )
+
+
+def outside_flow_h_dp(
+    Re: float,
+    Pr: float,
+    v: float,
+    rho: float,
+    k: float,
+    tube_outer_diameter: float,
+    n_rows: int,
+    *,
+    zeta_dp: float = 1.2,
+) -> tuple[float, float]:
+    """
+    Heat transfer / pressure drop half of `outside_flow_from_mass_flow`.
+
+    Takes the flow state from `outside_flow_velocity_reynolds`.
+
+    Returns
+    -------
+    h_o : float
+        Zukauskas heat transfer coefficient [W/(m^2*K)]
+    dp_o : float
+        Pressure drop [Pa], dp = zeta_dp * n_rows * rho*v^2/2
+    """
+    if not (Re > 0.0 and Pr > 0.0 and v > 0.0):
+        raise ValueError("Re, Pr and v must be positive.")
+    if not (rho > 0.0 and k > 0.0):
+        raise ValueError("rho and k must be positive.")
+    if tube_outer_diameter <= 0.0:
+        raise ValueError("tube_outer_diameter must be positive.")
     if zeta_dp <= 0.0:
         raise ValueError("zeta_dp must be positive.")
+    if n_rows <= 0:
+        raise ValueError("n_rows must be positive.")
+
+    return _outside_flow_h_dp_kernel(Re, Pr, v, rho, k, tube_outer_diameter, n_rows, zeta_dp)
 
-    v = m_dot / (props.rho * frontal_area)
 
-    Re = reynolds_number(props.rho, v, tube_outer_diameter, props.mu)
-    Pr = prandtl_number(props.cp, props.mu, props.k)
+def _nusselt_zukauskas_vec_fast(Re: np.ndarray, Pr: np.ndarray, n_rows: np.ndarray) -> np.ndarray:
+    # Unchecked body of `nusselt_zukauskas_vec`
+    band = np.searchsorted(_RE_EDGES_ARR, Re, side="right")
+    C = _ZUKAUSKAS_CM[band, 0]
+    m = _ZUKAUSKAS_CM[band, 1]
 
-    Nu = nusselt_zukauskas(Re, Pr, n_rows)
-    h_o = Nu * props.k / tube_outer_diameter
+    Nu = C * np.power(Re, m) * np.power(Pr, 0.36)
 
-    dp_o = zeta_dp * n_rows * (props.rho * v * v / 2.0)
+    return np.where(n_rows < 20.0, Nu * np.power(n_rows / 20.0, 0.20), Nu)
+
+
+def nusselt_zukauskas_vec(Re: np.ndarray, Pr: np.ndarray, n_rows: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `nusselt_zukauskas` (same Re bands, coefficients and row correction).
+    """
+    Re = np.asarray(Re, dtype=float)
+    Pr = np.asarray(Pr, dtype=float)
+    n_rows = np.asarray(n_rows, dtype=float)
+    if not (np.all(Re > 0.0) and np.all(Pr > 0.0)):
+        raise ValueError("Re and Pr must be positive.")
+    if not np.all(n_rows > 0.0):
+        raise ValueError("n_rows must be positive.")
+
+    return _nusselt_zukauskas_vec_fast(*np.broadcast_arrays(Re, Pr, n_rows))
+
+
+def _outside_flow_vec_kernel(
+    m_dot: np.ndarray,
+    frontal_area: np.ndarray,
+    D_o: np.ndarray,
+    n_rows: np.ndarray,
+    rho: np.ndarray,
+    mu: np.ndarray,
+    k: np.ndarray,
+    cp: np.ndarray,
+    zeta_dp: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Unvalidated body of `outside_flow_from_mass_flow_vec` (inputs already broadcast)."""
+    v = m_dot / (rho * frontal_area)
+    Re = rho * v * D_o / mu
+    Pr = cp * mu / k
+
+    Nu = _nusselt_zukauskas_vec_fast(Re, Pr, n_rows)
+    h_o = Nu * k / D_o
+
+    dp_o = zeta_dp * n_rows * (rho * v * v / 2.0)
 
     return v, Re, Pr, h_o, dp_o
+
+
+def outside_flow_from_mass_flow_vec(
+    m_dot: np.ndarray,
+    frontal_area: np.ndarray,
+    tube_outer_diameter: np.ndarray,
+    n_rows: np.ndarray,
+    rho: np.ndarray,
+    mu: np.ndarray,
+    k: np.ndarray,
+    cp: np.ndarray,
+    *,
+    zeta_dp: float = 1.2,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized `outside_flow_from_mass_flow` over arrays of operating points.
+
+    All array arguments may be scalars or NumPy arrays (e.g. a mass-flow sweep
+    against fixed geometry, or a property grid); they are broadcast against
+    each other.
+
+    Returns
+    -------
+    (v, Re, Pr, h_o, dp_o)
+        Tuple of arrays with the broadcast shape of the inputs, in the same
+        order as `outside_flow_from_mass_flow`.
+    """
+    if zeta_dp <= 0.0:
+        raise ValueError("zeta_dp must be positive.")
+
+    m_dot, frontal_area, D_o, n_rows, rho, mu, k, cp = (
+        np.asarray(x, dtype=float) for x in (m_dot, frontal_area, tube_outer_diameter, n_rows, rho, mu, k, cp)
+    )
+    # One pass per input array, before broadcasting
+    if not np.all(m_dot > 0.0):
+        raise ValueError("m_dot must be positive.")
+    if not np.all(frontal_area > 0.0):
+        raise ValueError("frontal_area must be positive.")
+    if not np.all(D_o > 0.0):
+        raise ValueError("tube_outer_diameter must be positive.")
+    if not np.all(n_rows > 0.0):
+        raise ValueError("n_rows must be positive.")
+    if not (np.all(rho > 0.0) and np.all(mu > 0.0) and np.all(k > 0.0) and np.all(cp > 0.0)):
+        raise ValueError("rho, mu, k and cp must be positive.")
+
+    return _outside_flow_vec_kernel(
+        *np.broadcast_arrays(m_dot, frontal_area, D_o, n_rows, rho, mu, k, cp), zeta_dp,
+    )
@@ -40,6 +40,41 @@ References
 - Shah & Sekulić, Fundamentals of Heat Exchanger Design
 """
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+class StreamKind(IntEnum):
+    """
+    Numeric stream type tag used by `StreamSpec`.
+
+    Batched solvers branch once on the tag (or on an array of tags) instead
+    of dispatching `EnergyStream` methods per operating point.
+    """
+
+    SENSIBLE = 0
+    CONDENSING = 1
+    MOIST = 2
+
+
+@dataclass(frozen=True, slots=True)
+class StreamSpec:
+    """
+    Plain numeric description of an energy stream (tagged union).
+
+    Fields not used by a kind are NaN:
+    - SENSIBLE: C, T_in
+    - CONDENSING: C = inf, T_in = T_sat
+    - MOIST: C (C_eff, NaN if not set), T_in, m_dot, h_in
+    """
+    kind: StreamKind
+    C: float                     # [W/K]
+    T_in: float                  # [K]
+    m_dot: float = float("nan")  # [kg/s]
+    h_in: float = float("nan")   # [J/kg_dry_air]
+
 
 class EnergyStream:
     """
@@ -47,6 +82,11 @@ class EnergyStream:
     participating in heat exchange.
     """
 
+    #: True when the stream stays at its inlet temperature (phase change).
+    #: ε–NTU callers then use C_r = 0 with the other stream's C instead of
+    #: the infinite `capacity_rate()`.
+    is_isothermal: bool = False
+
     def capacity_rate(self) -> float:
         """
         Effective heat capacity rate [W/K].
@@ -74,6 +114,12 @@ class EnergyStream:
         """
         raise NotImplementedError
 
+    def to_spec(self) -> StreamSpec:
+        """
+        Numeric snapshot of the stream for batched (array-based) solvers.
+        """
+        raise NotImplementedError
+
 
 class SensibleHeatStream(EnergyStream):
     """
@@ -110,6 +156,9 @@ class SensibleHeatStream(EnergyStream):
     def outlet_temperature(self, Q: float) -> float:
         return self._T_in - Q / self._C
 
+    def to_spec(self) -> StreamSpec:
+        return StreamSpec(kind=StreamKind.SENSIBLE, C=self._C, T_in=self._T_in)
+
 
 class CondensingSteamStream(EnergyStream):
     """
@@ -127,6 +176,8 @@ class CondensingSteamStream(EnergyStream):
     - condensers with isothermal hot side.
     """
 
+    is_isothermal = True
+
     def __init__(self, T_sat: float):
         """
         Parameters
@@ -147,6 +198,9 @@ class CondensingSteamStream(EnergyStream):
         # Temperature remains constant during condensation
         return self._T_sat
 
+    def to_spec(self) -> StreamSpec:
+        return StreamSpec(kind=StreamKind.CONDENSING, C=float("inf"), T_in=self._T_sat)
+
 class MoistAirStream(EnergyStream):
     """
     Moist air energy stream with possible condensation.
@@ -209,19 +263,33 @@ class MoistAirStream(EnergyStream):
 
     def outlet_temperature(self, Q: float) -> float:
         """
-        Outlet temperature after heat transfer.
+        Not available for moist air.
 
-        This method only updates enthalpy. Temperature must be
-        determined by psychrometric relations at a higher level.
-        """
-        h_out = self.h_in - Q / self.m_dot
+        The outlet state is only known as an enthalpy (`outlet_enthalpy`);
+        the outlet temperature must be determined by psychrometric
+        relations at a higher level (segmented / iterative solver).
 
-        # Temperature cannot be determined without psychrometrics
-        # Returning inlet temperature as placeholder
-        return self.T_in
+        Raises
+        ------
+        NotImplementedError
+            Always.
+        """
+        raise NotImplementedError(
+            "Use a psychrometric solver for the moist air outlet temperature "
+            "(see MoistAirStream.outlet_enthalpy)."
+        )
 
     def outlet_enthalpy(self, Q: float) -> float:
         """
         Outlet specific enthalpy [J/kg_dry_air].
         """
         return self.h_in - Q / self.m_dot
+
+    def to_spec(self) -> StreamSpec:
+        return StreamSpec(
+            kind=StreamKind.MOIST,
+            C=float("nan") if self.C_eff is None else self.C_eff,
+            T_in=self.T_in,
+            m_dot=self.m_dot,
+            h_in=self.h_in,
+        )
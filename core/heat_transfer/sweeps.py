@@ -0,0 +1,308 @@
+# KalKalori — Heat Exchanger Open Engine
+# Copyright (C) 2025  KalKalori Project Authors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# NOTE ON UNITS
+# -------------
+# SI units:
+# - m_dot [kg/s], D [m], L [m], A [m^2]
+# - C [W/K], UA [W/K], T [K], Q [W], h [W/(m^2*K)], dp [Pa]
+
+"""
+Design sweeps over many independent operating points.
+
+`design_sweep` evaluates a full factorial grid with NumPy broadcasting:
+each sweep axis is reshaped so it occupies its own dimension and all
+correlations are evaluated once over the grid instead of in nested Python
+loops.
+
+`sweep_designs` evaluates a list of arbitrary design points (one entry per
+point, no grid structure) in a single compiled loop that Numba distributes
+over all CPU cores.
+
+The relations are exactly those of the scalar building blocks:
+- tube-side h: `internal_flow.nusselt_internal` (Gnielinski / laminar / blend),
+- frictional Δp: Darcy–Weisbach with `internal_flow.friction_factor_smooth`,
+- thermal duty: `ntu.effectiveness_ntu` (Q = ε * Q_max).
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from core._jit import njit, prange
+from core.heat_transfer.internal_flow import (
+    FluidProps,
+    _thermo_hydraulic_kernel,
+    friction_factor_smooth_vec,
+    nusselt_internal_vec,
+)
+from core.heat_transfer.ntu import (
+    FlowArrangement,
+    _eps_cocurrentflow_kernel,
+    _eps_counterflow_kernel,
+    effectiveness_ntu_vec,
+)
+
+# Circle area factor; the same product as `BareTube.flow_area`
+_PI_QUARTER = 0.25 * math.pi
+
+
+def _axis(values: np.ndarray, name: str) -> np.ndarray:
+    arr = np.atleast_1d(np.asarray(values, dtype=float))
+    if arr.ndim != 1:
+        raise ValueError(f"{name} must be a scalar or a 1-D array.")
+    if not np.all(arr > 0.0):
+        raise ValueError(f"{name} must be positive.")
+    return arr
+
+
+def design_sweep(
+    m_dot: np.ndarray,
+    D_i: np.ndarray,
+    UA: np.ndarray,
+    *,
+    props: FluidProps,
+    n_tubes_per_pass: int,
+    flow_length: float,
+    C_outside: float,
+    T_tube_in: float,
+    T_outside_in: float,
+    flow_arrangement: str | FlowArrangement = "counterflow",
+) -> dict[str, np.ndarray]:
+    """
+    Evaluate a tube-side mass flow × tube diameter × UA grid in one pass.
+
+    Parameters
+    ----------
+    m_dot : array_like
+        Tube-side mass flow rates [kg/s] (sweep axis 0).
+    D_i : array_like
+        Tube inner diameters [m] (sweep axis 1).
+    UA : array_like
+        Overall conductances [W/K] (sweep axis 2). UA is an independent
+        sizing axis; it is not derived from the reported h.
+    props : FluidProps
+        Tube-side fluid properties at representative conditions.
+    n_tubes_per_pass : int
+        Number of tubes in parallel within one pass.
+    flow_length : float
+        Tube-side hydraulic length for friction losses [m].
+    C_outside : float
+        Outside-stream heat capacity rate [W/K].
+    T_tube_in, T_outside_in : float
+        Inlet temperatures [K]. Either side may be the hot one.
+    flow_arrangement : str or FlowArrangement
+        ε–NTU flow arrangement.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Arrays of shape (len(m_dot), len(D_i), len(UA)), keyed by:
+        "v", "Re", "Pr", "f", "Nu", "h", "dp_friction",
+        "eps", "Q", "T_tube_out", "T_outside_out".
+        Q is positive when heat flows from the tube side to the outside.
+
+    Notes
+    -----
+    Quantities that do not depend on an axis are returned as read-only
+    broadcast views, so no memory is spent on repeated values.
+    """
+    if n_tubes_per_pass <= 0:
+        raise ValueError("n_tubes_per_pass must be a positive integer.")
+    if flow_length <= 0.0:
+        raise ValueError("flow_length must be positive.")
+    if C_outside <= 0.0:
+        raise ValueError("C_outside must be positive.")
+    if not (props.rho > 0.0 and props.mu > 0.0 and props.k > 0.0 and props.cp > 0.0):
+        raise ValueError("rho, mu, k and cp must be positive.")
+
+    # Singleton-expanded axes: (N_m,1,1), (1,N_D,1), (1,1,N_UA)
+    m_dot = _axis(m_dot, "m_dot").reshape(-1, 1, 1)
+    D_i = _axis(D_i, "D_i").reshape(1, -1, 1)
+    UA = _axis(UA, "UA").reshape(1, 1, -1)
+    shape = (m_dot.shape[0], D_i.shape[1], UA.shape[2])
+
+    rho, mu, k, cp = props.rho, props.mu, props.k, props.cp
+
+    # --- Tube side: thermal + frictional (shape (N_m, N_D, 1)) ---
+    # Same arithmetic as `TubeBundle.internal_flow_area_per_pass`
+    flow_area = n_tubes_per_pass * (_PI_QUARTER * D_i * D_i)
+    v = m_dot / (rho * flow_area)
+    Re = rho * v * D_i / mu
+    Pr = cp * mu / k
+
+    f = friction_factor_smooth_vec(Re)
+    Nu = nusselt_internal_vec(Re, Pr)
+    h = Nu * k / D_i
+    dp_friction = f * (flow_length / D_i) * (0.5 * rho * v * v)
+
+    # --- ε–NTU (shape (N_m, 1, N_UA)) ---
+    C_tube = m_dot * cp
+    eps = effectiveness_ntu_vec(C_tube, C_outside, UA, flow_arrangement=flow_arrangement)
+
+    C_min = np.minimum(C_tube, C_outside)
+    Q = eps * C_min * (T_tube_in - T_outside_in)
+    T_tube_out = T_tube_in - Q / C_tube
+    T_outside_out = T_outside_in + Q / C_outside
+
+    results = {
+        "v": v,
+        "Re": Re,
+        "Pr": Pr,
+        "f": f,
+        "Nu": Nu,
+        "h": h,
+        "dp_friction": dp_friction,
+        "eps": eps,
+        "Q": Q,
+        "T_tube_out": T_tube_out,
+        "T_outside_out": T_outside_out,
+    }
+    return {key: np.broadcast_to(value, shape) for key, value in results.items()}
+
+
+@njit(parallel=True, cache=True)
+def _sweep_designs_kernel(
+    m_dot: np.ndarray,
+    D_i: np.ndarray,
+    flow_area: np.ndarray,
+    flow_length: np.ndarray,
+    UA: np.ndarray,
+    rho: float,
+    mu: float,
+    k: float,
+    cp: float,
+    C_outside: float,
+    fa_tag: int,
+    n_turns: float,
+    K_in: float,
+    K_out: float,
+    K_turn: float,
+) -> tuple[np.ndarray, ...]:
+    """Unvalidated body of `sweep_designs`; iterations are independent."""
+    n = m_dot.shape[0]
+    v = np.empty(n)
+    Re = np.empty(n)
+    Pr = np.empty(n)
+    f = np.empty(n)
+    Nu = np.empty(n)
+    h = np.empty(n)
+    dp_total = np.empty(n)
+    eps = np.empty(n)
+
+    for i in prange(n):
+        v[i], Re[i], Pr[i], f[i], Nu[i], h[i], dp_friction = _thermo_hydraulic_kernel(
+            m_dot[i], D_i[i], flow_area[i], flow_length[i], rho, mu, k, cp,
+        )
+        # Minor losses on the same dynamic pressure; summed in the order of
+        # `pressure_drop_internal_total`
+        q = 0.5 * rho * v[i] * v[i]
+        dp_total[i] = dp_friction + K_in * q + K_out * q + n_turns * K_turn * q
+
+        C_tube = m_dot[i] * cp
+        C_min = min(C_tube, C_outside)
+        C_r = C_min / max(C_tube, C_outside)
+        NTU = UA[i] / C_min
+        if fa_tag == 0:  # FlowArrangement.COUNTERFLOW
+            eps[i] = _eps_counterflow_kernel(NTU, C_r)
+        else:
+            eps[i] = _eps_cocurrentflow_kernel(NTU, C_r)
+
+    return v, Re, Pr, f, Nu, h, dp_total, eps
+
+
+def sweep_designs(
+    m_dot: np.ndarray,
+    D_i: np.ndarray,
+    flow_area: np.ndarray,
+    flow_length: np.ndarray,
+    UA: np.ndarray,
+    *,
+    props: FluidProps,
+    C_outside: float,
+    flow_arrangement: str | FlowArrangement = "counterflow",
+    n_turns: int = 0,
+    K_in: float = 0.5,
+    K_out: float = 1.0,
+    K_turn: float = 1.5,
+) -> dict[str, np.ndarray]:
+    """
+    Evaluate N independent tube-side design points in one parallel pass.
+
+    Parameters
+    ----------
+    m_dot : array_like
+        Tube-side mass flow rate per pass [kg/s].
+    D_i : array_like
+        Tube inner (hydraulic) diameter [m].
+    flow_area : array_like
+        Tube-side flow area per pass [m^2].
+    flow_length : array_like
+        Tube-side hydraulic length [m].
+    UA : array_like
+        Overall conductance [W/K].
+    props : FluidProps
+        Tube-side fluid properties, shared by all design points.
+    C_outside : float
+        Outside-stream heat capacity rate [W/K].
+    flow_arrangement : str or FlowArrangement
+        ε–NTU flow arrangement.
+    n_turns, K_in, K_out, K_turn
+        Minor-loss inputs of `pressure_drop_internal_total`.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        1-D arrays of length N (the broadcast length of the array inputs),
+        keyed by "v", "Re", "Pr", "f", "Nu", "h", "dp_total", "eps".
+
+    Notes
+    -----
+    Per point, the values equal `thermo_hydraulic_internal`,
+    `pressure_drop_internal_total(...).dp_total` and `effectiveness_ntu`
+    (tube side C = m_dot * cp against `C_outside`). With Numba the loop runs
+    in parallel across cores (``prange``); without it the same loop runs
+    serially in Python.
+    """
+    if C_outside <= 0.0:
+        raise ValueError("C_outside must be positive.")
+    if not (props.rho > 0.0 and props.mu > 0.0 and props.k > 0.0 and props.cp > 0.0):
+        raise ValueError("rho, mu, k and cp must be positive.")
+    if n_turns < 0:
+        raise ValueError("n_turns must be non-negative.")
+    if K_in < 0.0 or K_out < 0.0 or K_turn < 0.0:
+        raise ValueError("K_in, K_out and K_turn must be non-negative.")
+
+    fa = FlowArrangement.parse(flow_arrangement)
+
+    arrays = np.broadcast_arrays(
+        _axis(m_dot, "m_dot"),
+        _axis(D_i, "D_i"),
+        _axis(flow_area, "flow_area"),
+        _axis(flow_length, "flow_length"),
+        _axis(UA, "UA"),
+    )
+    # Contiguous copies: the compiled loop indexes plain 1-D arrays
+    m_dot, D_i, flow_area, flow_length, UA = (np.ascontiguousarray(a) for a in arrays)
+
+    outputs = _sweep_designs_kernel(
+        m_dot, D_i, flow_area, flow_length, UA,
+        props.rho, props.mu, props.k, props.cp, float(C_outside),
+        int(fa), float(n_turns), float(K_in), float(K_out), float(K_turn),
+    )
+    keys = ("v", "Re", "Pr", "f", "Nu", "h", "dp_total", "eps")
+    return dict(zip(keys, outputs))
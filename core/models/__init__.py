@@ -11,6 +11,7 @@ usable engineering objects.
 from .bare_tube import (
     BareTubeHeatExchanger,
     HXResult,
+    HXBatchResult,
     HXOutSideThermalResults,
     HXTubeSideHydraulicResults,
     HXOutSideHydraulicResults,
@@ -19,6 +20,7 @@ from .bare_tube import (
 __all__ = [
     "BareTubeHeatExchanger",
     "HXResult",
+    "HXBatchResult",
     "HXOutSideThermalResults",
     "HXTubeSideHydraulicResults",
     "HXOutSideHydraulicResults",
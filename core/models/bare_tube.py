@@ -22,42 +22,59 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from typing import NamedTuple
+
+import numpy as np
+
+from core._jit import HAVE_NUMBA, njit, numba, prange
 
 from core.geometry.bundle import TubeBundle
 
+from core.heat_transfer.fluid_props import FluidProps
+
 from core.heat_transfer.internal_flow import (
-    FluidProps as InternalFlowFluidProps,
-    heat_transfer_coefficient_internal,
+    FluidPropsArray,
+    _heat_transfer_coefficient_kernel,
+    _nusselt_internal_vec_fast,
+    _validate_internal_inputs,
 )
 
 from core.heat_transfer.internal_pressure_drop import (
-    FluidProps as InternalDPFluidProps,
-    pressure_drop_internal_total,
+    _pressure_drop_internal_kernel,
+    _pressure_drop_internal_vec_kernel,
+    _validate_pressure_drop_inputs,
 )
 
 from core.heat_transfer.outside_flow import (
-    FluidProps as OutsideFlowFluidProps,
-    outside_flow_from_mass_flow,
+    _outside_dp_fast,
+    _outside_flow_h_dp_kernel,
+    _outside_flow_state_kernel,
+    _validate_outside_inputs,
+    outside_flow_from_mass_flow_vec,
 )
 
 from core.heat_transfer.ntu import (
-    effectiveness_ntu,
-    heat_duty_from_effectiveness,
+    FlowArrangement,
+    _eps_cocurrentflow_kernel,
+    _eps_counterflow_kernel,
+    effectiveness_ntu_vec,
+    heat_duty_from_effectiveness_vec,
 )
 
-from core.heat_transfer.streams import EnergyStream
+from core.heat_transfer.streams import EnergyStream, StreamKind
+
+_log = math.log
+_TWO_PI = 2.0 * math.pi
 
 
-@dataclass(frozen=True)
-class HXOutSideThermalResults:
+class HXOutSideThermalResults(NamedTuple):
     v: float
     Re: float
     Pr: float
     h: float
 
 
-@dataclass(frozen=True)
-class HXTubeSideHydraulicResults:
+class HXTubeSideHydraulicResults(NamedTuple):
     dp_total: float
     dp_tubes: float
     dp_inlet: float
@@ -68,15 +85,13 @@ class HXTubeSideHydraulicResults:
     v: float
 
 
-@dataclass(frozen=True)
-class HXOutSideHydraulicResults:
+class HXOutSideHydraulicResults(NamedTuple):
     dp_total: float
     Re: float
     v: float
 
 
-@dataclass(frozen=True)
-class HXResult:
+class HXResult(NamedTuple):
     # Geometry / areas
     A_i: float          # [m^2] inner heat transfer area (effective)
     A_o: float          # [m^2] outer heat transfer area (effective)
@@ -97,6 +112,259 @@ class HXResult:
     outside_side_hydraulic: HXOutSideHydraulicResults
 
 
+class HXBatchResult(NamedTuple):
+    """
+    Results of `BareTubeHeatExchanger.solve_batch` (structure of arrays).
+
+    Per-point fields are read-only arrays with the broadcast shape of the
+    operating-point inputs; field names follow `HXResult` and its
+    diagnostics, flattened with `_i` (tube side) / `_o` (outside) suffixes.
+    """
+    # Geometry / areas (loop-invariant)
+    A_i: float                 # [m^2]
+    A_o: float                 # [m^2]
+    A_frontal: float           # [m^2]
+
+    # Thermal performance
+    UA: np.ndarray             # [W/K]
+    eps: np.ndarray            # [-]
+    Q: np.ndarray              # [W]
+    T_hot_out: np.ndarray      # [K]
+    T_cold_out: np.ndarray     # [K]
+
+    # Tube side
+    v_i: np.ndarray            # [m/s]
+    Re_i: np.ndarray           # [-]
+    Pr_i: np.ndarray           # [-]
+    h_i: np.ndarray            # [W/(m^2*K)]
+    f_i: np.ndarray            # [-] Darcy friction factor
+    dp_i_total: np.ndarray     # [Pa]
+    dp_i_tubes: np.ndarray     # [Pa]
+    dp_i_inlet: np.ndarray     # [Pa]
+    dp_i_outlet: np.ndarray    # [Pa]
+    dp_i_turns: np.ndarray     # [Pa]
+
+    # Outside (NaN where not computed from mass flow)
+    v_o: np.ndarray            # [m/s]
+    Re_o: np.ndarray           # [-]
+    Pr_o: np.ndarray           # [-]
+    h_o: np.ndarray            # [W/(m^2*K)] (value used for UA)
+    dp_o: np.ndarray           # [Pa]
+
+
+def _ua_from(
+    h_i: float | np.ndarray,
+    A_i: float,
+    h_o: float | np.ndarray,
+    A_o: float,
+    R_w: float,
+) -> float | np.ndarray:
+    """
+    Overall conductance UA [W/K] from the series resistances
+    1/(h_i*A_i) + R_w + 1/(h_o*A_o).
+
+    Works elementwise on NumPy arrays of h_i / h_o (R_w is a scalar).
+    Without a wall term the two film conductances G combine as
+    G_i*G_o/(G_i + G_o), which takes one division instead of three.
+    """
+    G_i = h_i * A_i
+    G_o = h_o * A_o
+    if R_w == 0.0:
+        return G_i * G_o / (G_i + G_o)
+    return 1.0 / (1.0 / G_i + R_w + 1.0 / G_o)
+
+
+# -----------------------------
+# Compiled numeric core
+# -----------------------------
+# `_solve_core` is the numeric body of `BareTubeHeatExchanger.solve` for one
+# operating point, built from the same unchecked kernels as the public
+# correlations; callers validate all inputs first. Results are returned as
+# a flat tuple in `_CORE_FIELDS` order.
+
+_CORE_FIELDS = (
+    "v_i", "Re_i", "Pr_i", "h_i",
+    "dp_i_total", "dp_i_tubes", "dp_i_inlet", "dp_i_outlet", "dp_i_turns", "Re_dp", "f_i", "v_dp",
+    "v_o", "Re_o", "Pr_o", "h_o", "dp_o",
+    "UA", "eps", "Q", "T_hot_out", "T_cold_out",
+)
+_N_CORE_FIELDS = len(_CORE_FIELDS)
+
+# Below this many points `solve_batch` stays on the NumPy path; thread
+# start-up of the parallel compiled loop only pays off for large batches.
+# Single-threaded, the NumPy path is faster at any size.
+_PARALLEL_MIN_POINTS = 10_000
+
+
+@njit(cache=True)
+def _ua_fast(G_i: float, G_o: float, R_w: float) -> float:
+    # Same expressions as `_ua_from`
+    if R_w == 0.0:
+        return G_i * G_o / (G_i + G_o)
+    return 1.0 / (1.0 / G_i + R_w + 1.0 / G_o)
+
+
+@njit(cache=True)
+def _solve_core(
+    m_dot_t: float,
+    m_dot_o: float,
+    h_o_override: float,
+    have_outside: bool,
+    A_i: float,
+    A_o: float,
+    A_frontal: float,
+    D_h: float,
+    flow_area_pass: float,
+    L_int: float,
+    n_turns: float,
+    n_rows: int,
+    D_o: float,
+    rho_t: float,
+    mu_t: float,
+    k_t: float,
+    cp_t: float,
+    rho_o: float,
+    mu_o: float,
+    k_o: float,
+    cp_o: float,
+    zeta_dp: float,
+    R_w: float,
+    K_in: float,
+    K_out: float,
+    K_turn: float,
+    C_hot: float,
+    C_cold: float,
+    hot_iso: bool,
+    cold_iso: bool,
+    T_hot_in: float,
+    T_cold_in: float,
+    fa_code: int,
+) -> tuple[float, ...]:
+    """Unvalidated numeric body of `BareTubeHeatExchanger.solve`."""
+    nan = math.nan
+
+    # Tube side: thermal + hydraulic
+    v_i, Re_i, Pr_i, h_i = _heat_transfer_coefficient_kernel(
+        m_dot_t, D_h, flow_area_pass, rho_t, mu_t, k_t, cp_t,
+    )
+    dp_total, dp_tubes, dp_in, dp_out, dp_turns, Re_dp, f, v_dp = _pressure_drop_internal_kernel(
+        m_dot_t, flow_area_pass, D_h, L_int, rho_t, mu_t, n_turns, K_in, K_out, K_turn,
+    )
+
+    # Outside: flow state from mass flow; a positive override replaces h_o,
+    # so only dp_o is evaluated (no Nusselt correlation)
+    if have_outside:
+        v_o, Re_o, Pr_o = _outside_flow_state_kernel(m_dot_o, A_frontal, D_o, rho_o, mu_o, k_o, cp_o)
+        if h_o_override > 0.0:
+            h_o = h_o_override
+            dp_o = _outside_dp_fast(rho_o, v_o, n_rows, zeta_dp)
+        else:
+            h_o, dp_o = _outside_flow_h_dp_kernel(Re_o, Pr_o, v_o, rho_o, k_o, D_o, n_rows, zeta_dp)
+    else:
+        v_o, Re_o, Pr_o, dp_o = nan, nan, nan, nan
+        h_o = h_o_override
+
+    UA = _ua_fast(h_i * A_i, h_o * A_o, R_w)
+
+    # ε–NTU (C_r = 0 closed form with an isothermal side) and duty
+    dT_in = T_hot_in - T_cold_in
+    if hot_iso:
+        eps = -math.expm1(-UA / C_cold)
+        Q = eps * (C_cold * dT_in)
+        T_hot_out = T_hot_in
+        T_cold_out = T_cold_in + Q / C_cold
+    elif cold_iso:
+        eps = -math.expm1(-UA / C_hot)
+        Q = eps * (C_hot * dT_in)
+        T_hot_out = T_hot_in - Q / C_hot
+        T_cold_out = T_cold_in
+    else:
+        C_min = min(C_hot, C_cold)
+        C_r = C_min / max(C_hot, C_cold)
+        NTU = UA / C_min
+        if fa_code == 0:  # FlowArrangement.COUNTERFLOW
+            eps = _eps_counterflow_kernel(NTU, C_r)
+        else:
+            eps = _eps_cocurrentflow_kernel(NTU, C_r)
+        Q = eps * (C_min * dT_in)
+        T_hot_out = T_hot_in - Q / C_hot
+        T_cold_out = T_cold_in + Q / C_cold
+
+    return (
+        v_i, Re_i, Pr_i, h_i,
+        dp_total, dp_tubes, dp_in, dp_out, dp_turns, Re_dp, f, v_dp,
+        v_o, Re_o, Pr_o, h_o, dp_o,
+        UA, eps, Q, T_hot_out, T_cold_out,
+    )
+
+
+@njit(parallel=True, cache=True)
+def _solve_core_batch(
+    m_dot_t: np.ndarray,
+    m_dot_o: np.ndarray,
+    h_o_override: np.ndarray,
+    have_outside: bool,
+    A_i: float,
+    A_o: float,
+    A_frontal: float,
+    D_h: float,
+    flow_area_pass: float,
+    L_int: float,
+    n_turns: float,
+    n_rows: int,
+    D_o: float,
+    rho_t: np.ndarray,
+    mu_t: np.ndarray,
+    k_t: np.ndarray,
+    cp_t: np.ndarray,
+    rho_o: np.ndarray,
+    mu_o: np.ndarray,
+    k_o: np.ndarray,
+    cp_o: np.ndarray,
+    zeta_dp: float,
+    R_w: float,
+    K_in: float,
+    K_out: float,
+    K_turn: float,
+    C_hot: np.ndarray,
+    C_cold: np.ndarray,
+    hot_iso: np.ndarray,
+    cold_iso: np.ndarray,
+    T_hot_in: np.ndarray,
+    T_cold_in: np.ndarray,
+    fa_code: int,
+) -> np.ndarray:
+    """`_solve_core` over 1-D arrays of operating points, in parallel; shape (N, fields)."""
+    n = m_dot_t.shape[0]
+    out = np.empty((n, _N_CORE_FIELDS))
+    for i in prange(n):
+        r = _solve_core(
+            m_dot_t[i], m_dot_o[i], h_o_override[i], have_outside,
+            A_i, A_o, A_frontal, D_h, flow_area_pass, L_int, n_turns, n_rows, D_o,
+            rho_t[i], mu_t[i], k_t[i], cp_t[i], rho_o[i], mu_o[i], k_o[i], cp_o[i],
+            zeta_dp, R_w, K_in, K_out, K_turn,
+            C_hot[i], C_cold[i], hot_iso[i], cold_iso[i], T_hot_in[i], T_cold_in[i], fa_code,
+        )
+        for j in range(_N_CORE_FIELDS):
+            out[i, j] = r[j]
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class _Geom:
+    """Loop-invariant exchanger geometry, cached on `BareTubeHeatExchanger`."""
+    A_i: float              # [m^2] total inner area (effective)
+    A_o: float              # [m^2] total outer area (effective)
+    A_frontal: float        # [m^2] outside frontal flow area
+    D_h: float              # [m] tube-side hydraulic diameter
+    flow_area_pass: float   # [m^2] tube-side flow area per pass
+    L_int: float            # [m] tube-side hydraulic length (all passes)
+    n_turns: int            # [-] tube-side 180° returns
+    n_rows: int             # [-] tube rows in outside flow direction
+    D_o: float | None       # [m] tube outer diameter (None if the tube has none)
+    R_w: float              # [K/W] total wall conduction resistance
+
+
 class BareTubeHeatExchanger:
     """
     Bare (smooth) tube heat exchanger model (MVP).
@@ -109,6 +377,7 @@ class BareTubeHeatExchanger:
     - Outside side: forced flow from mass flow rate -> h_o and dp_o (MVP)
     - Overall thermal duty: ε–NTU with flow_arrangement:
         "counterflow", "cocurrentflow", "crossflow"
+    - `solve_batch`: the same model over NumPy arrays of operating points
 
     Literature anchors in code
     --------------------------
@@ -117,8 +386,49 @@ class BareTubeHeatExchanger:
     """
 
     def __init__(self, bundle: TubeBundle, wall_k: float | None = None):
-        self.bundle = bundle
-        self.wall_k = wall_k
+        self._bundle = bundle
+        self.wall_k = wall_k  # builds the geometry cache
+
+    @property
+    def bundle(self) -> TubeBundle:
+        """Tube bundle geometry (immutable; reassigning rebuilds the geometry cache)."""
+        return self._bundle
+
+    @bundle.setter
+    def bundle(self, value: TubeBundle) -> None:
+        self._bundle = value
+        self._geom = self._build_geom()
+
+    @property
+    def wall_k(self) -> float | None:
+        """Tube wall thermal conductivity [W/(m*K)]; None neglects the wall."""
+        return self._wall_k
+
+    @wall_k.setter
+    def wall_k(self, value: float | None) -> None:
+        self._wall_k = value
+        self._geom = self._build_geom()
+
+    def _build_geom(self) -> _Geom:
+        """
+        Collect the loop-invariant geometry used by `solve` / `solve_batch`.
+
+        The bundle and its tube are immutable, so this only needs to run when
+        `bundle` or `wall_k` is reassigned (handled by their setters).
+        """
+        bundle = self.bundle
+        return _Geom(
+            A_i=bundle.total_inner_area,
+            A_o=bundle.total_outer_area,
+            A_frontal=bundle.frontal_flow_area,
+            D_h=bundle.internal_hydraulic_diameter,
+            flow_area_pass=bundle.internal_flow_area_per_pass,
+            L_int=bundle.internal_length_total,
+            n_turns=bundle.n_turns,
+            n_rows=bundle.n_rows,
+            D_o=getattr(bundle.tube, "D_o", None),
+            R_w=self._tube_wall_resistance(),
+        )
 
     def _tube_wall_resistance(self) -> float:
         """
@@ -134,17 +444,21 @@ class BareTubeHeatExchanger:
             raise ValueError("wall_k must be positive.")
 
         tube = self.bundle.tube
-        if not all(hasattr(tube, a) for a in ("D_i", "D_o", "length_effective")):
-            raise ValueError("Tube must provide D_i, D_o, length_effective for wall resistance.")
-
-        Di = float(getattr(tube, "D_i"))
-        Do = float(getattr(tube, "D_o"))
-        L_eff = float(getattr(tube, "length_effective"))
+        try:
+            Di, Do, L_eff = tube.D_i, tube.D_o, tube.length_effective
+        except AttributeError:
+            raise ValueError("Tube must provide D_i, D_o, length_effective for wall resistance.") from None
         if Do <= Di:
             raise ValueError("Tube outer diameter must exceed inner diameter.")
 
         N = self.bundle.n_tubes_total
-        return math.log(Do / Di) / (2.0 * math.pi * self.wall_k * L_eff * N)
+        return _log(Do / Di) / (_TWO_PI * self.wall_k * L_eff * N)
+
+    def _outer_diameter(self) -> float:
+        D_o = self._geom.D_o
+        if D_o is None:
+            raise ValueError("Tube must provide D_o for outside flow.")
+        return D_o
 
     def solve(
         self,
@@ -153,11 +467,11 @@ class BareTubeHeatExchanger:
         *,
         # Tube-side (total across exchanger):
         m_dot_tube_side: float,
-        tube_side_props: InternalFlowFluidProps,
+        tube_side_props: FluidProps,
 
         # Outside-side (preferred path):
         m_dot_outside: float | None = None,
-        outside_props: OutsideFlowFluidProps | None = None,
+        outside_props: FluidProps | None = None,
         zeta_dp_outside: float = 1.2,
 
         # Tube-side DP coefficients (MVP defaults exist in DP module; caller may override):
@@ -169,84 +483,257 @@ class BareTubeHeatExchanger:
         h_o: float | None = None,
 
         # Thermal flow arrangement:
-        flow_arrangement: str | None = None,
+        flow_arrangement: str | FlowArrangement | None = None,
 
     ) -> HXResult:
-        # Use bundle's flow_arrangement if not provided
+        # Use bundle's (pre-parsed) flow_arrangement if not provided
         if flow_arrangement is None:
-            flow_arrangement = self.bundle.flow_arrangement
+            flow_arrangement = self.bundle.flow_arrangement_code
+        fa = FlowArrangement.parse(flow_arrangement)
 
         if m_dot_tube_side <= 0.0:
             raise ValueError("m_dot_tube_side must be positive.")
 
-        # --- Areas (effective) ---
-        A_i = self.bundle.total_inner_area
-        A_o = self.bundle.total_outer_area
-        A_frontal = self.bundle.frontal_flow_area
+        g = self._geom
 
         # --------------------------------------------------------------
-        # Tube-side: thermal (per pass flow area)
+        # Validate once; the compiled core below runs unchecked
         # --------------------------------------------------------------
         # m_dot_tube_side is total across exchanger. In a multi-pass bundle,
         # the flow is distributed among tubes within a pass.
-        flow_area_pass = self.bundle.internal_flow_area_per_pass
-        D_h = self.bundle.internal_hydraulic_diameter
-
-        v_i, Re_i, Pr_i, h_i = heat_transfer_coefficient_internal(
-            m_dot=m_dot_tube_side,
-            tube_inner_diameter=D_h,
-            flow_area=flow_area_pass,
-            props=tube_side_props,
+        _validate_internal_inputs(m_dot_tube_side, g.D_h, g.flow_area_pass, tube_side_props)
+        _validate_pressure_drop_inputs(
+            m_dot_tube_side, g.flow_area_pass, g.D_h, g.L_int, tube_side_props,
+            g.n_turns, K_inlet, K_outlet, K_turn,
         )
-        tube_thermal = HXOutSideThermalResults(v=v_i, Re=Re_i, Pr=Pr_i, h=h_i)
 
-        # --------------------------------------------------------------
-        # Tube-side: hydraulic (component-based, includes passes)
-        # --------------------------------------------------------------
-        dp_total, dp_tubes, dp_in, dp_out, dp_turns, Re_dp, f, v_dp = pressure_drop_internal_total(
-            m_dot=m_dot_tube_side,
-            flow_area=flow_area_pass,
-            hydraulic_diameter=D_h,
-            flow_length=self.bundle.internal_length_total,
-            props=InternalDPFluidProps(rho=tube_side_props.rho, mu=tube_side_props.mu),
-            n_turns=self.bundle.n_turns,
-            K_in=K_inlet,
-            K_out=K_outlet,
-            K_turn=K_turn,
+        # Outside: compute from mass flow unless overridden
+        have_outside = (m_dot_outside is not None) and (outside_props is not None)
+        if have_outside:
+            D_o = self._outer_diameter()
+            _validate_outside_inputs(
+                m_dot_outside, g.A_frontal, D_o, g.n_rows, outside_props, zeta_dp_outside,
+            )
+            rho_o, mu_o, k_o, cp_o = outside_props.rho, outside_props.mu, outside_props.k, outside_props.cp
+        else:
+            m_dot_outside = D_o = rho_o = mu_o = k_o = cp_o = math.nan
+
+        if h_o is not None:
+            if h_o <= 0.0:
+                raise ValueError("h_o must be positive when provided.")
+            h_o_override = h_o
+        else:
+            if not have_outside:
+                raise ValueError(
+                    "Outside side not specified. Provide either:\n"
+                    "- (m_dot_outside and outside_props) to compute h_o, or\n"
+                    "- h_o directly as an override."
+                )
+            h_o_override = math.nan
+
+        # ε–NTU: an isothermal side (C_r = 0) uses the closed form and its
+        # infinite capacity rate never enters the arithmetic
+        hot_iso = hot_stream.is_isothermal
+        cold_iso = cold_stream.is_isothermal
+        if hot_iso and cold_iso:
+            raise ValueError("At most one stream can be isothermal.")
+        C_hot = math.nan if hot_iso else hot_stream.capacity_rate()
+        C_cold = math.nan if cold_iso else cold_stream.capacity_rate()
+        if C_hot <= 0.0 or C_cold <= 0.0:
+            raise ValueError("C_hot and C_cold must be positive.")
+
+        (
+            v_i, Re_i, Pr_i, h_i,
+            dp_total, dp_tubes, dp_in, dp_out, dp_turns, Re_dp, f, v_dp,
+            v_o, Re_o, Pr_o, h_o_used, dp_o,
+            UA, eps, Q, T_hot_out, T_cold_out,
+        ) = _solve_core(
+            m_dot_tube_side, m_dot_outside, h_o_override, have_outside,
+            g.A_i, g.A_o, g.A_frontal, g.D_h, g.flow_area_pass, g.L_int,
+            float(g.n_turns), g.n_rows, D_o,
+            tube_side_props.rho, tube_side_props.mu, tube_side_props.k, tube_side_props.cp,
+            rho_o, mu_o, k_o, cp_o, zeta_dp_outside, g.R_w, K_inlet, K_outlet, K_turn,
+            C_hot, C_cold, hot_iso, cold_iso,
+            hot_stream.inlet_temperature(), cold_stream.inlet_temperature(), int(fa),
         )
 
-        tube_hyd = HXTubeSideHydraulicResults(
-            dp_total=dp_total,
-            dp_tubes=dp_tubes,
-            dp_inlet=dp_in,
-            dp_outlet=dp_out,
-            dp_turns=dp_turns,
-            Re=Re_dp,
-            f=f,
-            v=v_dp,
+        return HXResult(
+            A_i=g.A_i,
+            A_o=g.A_o,
+            A_frontal=g.A_frontal,
+            UA=UA,
+            eps=eps,
+            Q=Q,
+            T_hot_out=T_hot_out,
+            T_cold_out=T_cold_out,
+            tube_side_thermal=HXOutSideThermalResults(v=v_i, Re=Re_i, Pr=Pr_i, h=h_i),
+            tube_side_hydraulic=HXTubeSideHydraulicResults(
+                dp_total=dp_total,
+                dp_tubes=dp_tubes,
+                dp_inlet=dp_in,
+                dp_outlet=dp_out,
+                dp_turns=dp_turns,
+                Re=Re_dp,
+                f=f,
+                v=v_dp,
+            ),
+            outside_side_thermal=HXOutSideThermalResults(v=v_o, Re=Re_o, Pr=Pr_o, h=h_o_used),
+            outside_side_hydraulic=HXOutSideHydraulicResults(dp_total=dp_o, Re=Re_o, v=v_o),
         )
 
+    def solve_batch(
+        self,
+        C_hot: np.ndarray,
+        T_hot_in: np.ndarray,
+        C_cold: np.ndarray,
+        T_cold_in: np.ndarray,
+        *,
+        # Tube-side (total across exchanger):
+        m_dot_tube_side: np.ndarray,
+        tube_side_props: FluidProps | FluidPropsArray,
+
+        # Outside-side (preferred path):
+        m_dot_outside: np.ndarray | None = None,
+        outside_props: FluidProps | FluidPropsArray | None = None,
+        zeta_dp_outside: float = 1.2,
+
+        # Tube-side DP coefficients:
+        K_inlet: float = 0.5,
+        K_outlet: float = 1.0,
+        K_turn: float = 1.5,
+
+        # Outside h override (validation / calibration):
+        h_o: np.ndarray | None = None,
+
+        # Thermal flow arrangement:
+        flow_arrangement: str | FlowArrangement | None = None,
+
+        # Stream kinds (StreamSpec tags), scalar or per point:
+        hot_kind: StreamKind | np.ndarray = StreamKind.SENSIBLE,
+        cold_kind: StreamKind | np.ndarray = StreamKind.SENSIBLE,
+
+    ) -> HXBatchResult:
+        """
+        Solve many operating points of this exchanger in one vectorized pass.
+
+        Same model as `solve`, with the streams given in `StreamSpec` form
+        (heat capacity rate [W/K], inlet temperature [K] and `StreamKind`
+        tag) instead of `EnergyStream` objects; `EnergyStream.to_spec()`
+        gives these values. A condensing side has C = inf.
+        All operating-point arguments, including the fields of
+        `FluidPropsArray` properties, may be scalars or NumPy arrays and are
+        broadcast against each other. Geometry is evaluated once.
+
+        Returns
+        -------
+        HXBatchResult
+            Per-point arrays; element i equals `solve` at operating point i.
+
+        Notes
+        -----
+        With Numba and more than one thread, batches of at least
+        `_PARALLEL_MIN_POINTS` points run the compiled core of `solve`
+        across cores (``prange``) instead of the NumPy pipeline.
+        """
+        if flow_arrangement is None:
+            flow_arrangement = self.bundle.flow_arrangement_code
+        # Parse up front: an all-isothermal batch never reaches ε–NTU
+        fa = FlowArrangement.parse(flow_arrangement)
+
+        C_hot = np.asarray(C_hot, dtype=float)
+        C_cold = np.asarray(C_cold, dtype=float)
+        T_hot_in = np.asarray(T_hot_in, dtype=float)
+        T_cold_in = np.asarray(T_cold_in, dtype=float)
+        m_dot_tube_side = np.asarray(m_dot_tube_side, dtype=float)
+        if not np.all(m_dot_tube_side > 0.0):
+            raise ValueError("m_dot_tube_side must be positive.")
+
+        # Large batches on multi-core machines: one parallel compiled pass
+        # over `_solve_core`
+        if HAVE_NUMBA and numba.get_num_threads() > 1:
+            outside_fields = () if outside_props is None else (
+                outside_props.rho, outside_props.mu, outside_props.k, outside_props.cp,
+            )
+            shape = np.broadcast_shapes(*(np.shape(x) for x in (
+                C_hot, T_hot_in, C_cold, T_cold_in, m_dot_tube_side,
+                tube_side_props.rho, tube_side_props.mu, tube_side_props.k, tube_side_props.cp,
+                m_dot_outside, *outside_fields, h_o, hot_kind, cold_kind,
+            )))
+            if math.prod(shape) >= _PARALLEL_MIN_POINTS:
+                return self._solve_batch_parallel(
+                    shape, C_hot, T_hot_in, C_cold, T_cold_in,
+                    m_dot_tube_side=m_dot_tube_side,
+                    tube_side_props=tube_side_props,
+                    m_dot_outside=m_dot_outside,
+                    outside_props=outside_props,
+                    zeta_dp_outside=zeta_dp_outside,
+                    K_inlet=K_inlet,
+                    K_outlet=K_outlet,
+                    K_turn=K_turn,
+                    h_o=h_o,
+                    flow_arrangement=fa,
+                    hot_kind=hot_kind,
+                    cold_kind=cold_kind,
+                )
+
+        # --- Loop-invariant geometry ---
+        g = self._geom
+        A_i = g.A_i
+        A_o = g.A_o
+        A_frontal = g.A_frontal
+        D_h = g.D_h
+
         # --------------------------------------------------------------
-        # Outside-side: compute from mass flow unless overridden
+        # Tube-side: thermal + hydraulic
         # --------------------------------------------------------------
-        have_outside = (m_dot_outside is not None) and (outside_props is not None)
+        rho_i = np.asarray(tube_side_props.rho, dtype=float)
+        mu_i = np.asarray(tube_side_props.mu, dtype=float)
+        k_i = np.asarray(tube_side_props.k, dtype=float)
+        cp_i = np.asarray(tube_side_props.cp, dtype=float)
+        # One pass per input array; the kernels below run unchecked
+        if not (np.all(rho_i > 0.0) and np.all(mu_i > 0.0) and np.all(k_i > 0.0) and np.all(cp_i > 0.0)):
+            raise ValueError("rho, mu, k and cp must be positive.")
+        if K_inlet < 0.0 or K_outlet < 0.0 or K_turn < 0.0:
+            raise ValueError("K_in, K_out and K_turn must be non-negative.")
+
+        dp_i_total, dp_i_tubes, dp_i_in, dp_i_out, dp_i_turns, Re_i, f_i, v_i = _pressure_drop_internal_vec_kernel(
+            m_dot_tube_side,
+            g.flow_area_pass,
+            D_h,
+            g.L_int,
+            rho_i,
+            mu_i,
+            g.n_turns,
+            K_inlet,
+            K_outlet,
+            K_turn,
+        )
+        Pr_i = cp_i * mu_i / k_i
+        h_i = _nusselt_internal_vec_fast(Re_i, Pr_i) * k_i / D_h
 
-        if have_outside:
-            v_o, Re_o, Pr_o, h_o_calc, dp_o = outside_flow_from_mass_flow(
-                m_dot=m_dot_outside,
-                frontal_area=A_frontal,
-                tube_outer_diameter=float(getattr(self.bundle.tube, "D_o")),
-                n_rows=self.bundle.n_rows,
-                props=outside_props,
+        # --------------------------------------------------------------
+        # Outside-side: compute from mass flow unless overridden
+        # --------------------------------------------------------------
+        if (m_dot_outside is not None) and (outside_props is not None):
+            v_o, Re_o, Pr_o, h_o_calc, dp_o = outside_flow_from_mass_flow_vec(
+                m_dot_outside,
+                A_frontal,
+                self._outer_diameter(),
+                g.n_rows,
+                outside_props.rho,
+                outside_props.mu,
+                outside_props.k,
+                outside_props.cp,
                 zeta_dp=zeta_dp_outside,
             )
         else:
-            v_o, Re_o, Pr_o, h_o_calc, dp_o = float("nan"), float("nan"), float("nan"), None, float("nan")
+            v_o = Re_o = Pr_o = dp_o = np.float64(np.nan)
+            h_o_calc = None
 
         if h_o is not None:
-            if h_o <= 0.0:
+            h_o_used = np.asarray(h_o, dtype=float)
+            if not np.all(h_o_used > 0.0):
                 raise ValueError("h_o must be positive when provided.")
-            h_o_used = h_o
         else:
             if h_o_calc is None:
                 raise ValueError(
@@ -256,49 +743,158 @@ class BareTubeHeatExchanger:
                 )
             h_o_used = h_o_calc
 
-        outside_thermal = HXOutSideThermalResults(v=v_o, Re=Re_o, Pr=Pr_o, h=h_o_used)
-        outside_hyd = HXOutSideHydraulicResults(dp_total=dp_o, Re=Re_o, v=v_o)
-
         # --------------------------------------------------------------
-        # Overall UA
+        # Overall UA and ε–NTU thermal duty
         # --------------------------------------------------------------
-        R_i = 1.0 / (h_i * A_i)
-        R_o = 1.0 / (h_o_used * A_o)
-        R_w = self._tube_wall_resistance()
-
-        R_tot = R_i + R_w + R_o
-        if R_tot <= 0.0:
-            raise ValueError("Invalid total thermal resistance.")
-
-        UA = 1.0 / R_tot
+        UA = _ua_from(h_i, A_i, h_o_used, A_o, g.R_w)
+
+        # With an isothermal side (C_r = 0) ε has a closed form in the
+        # sensible C, and the C of the isothermal side (inf or unset) never
+        # enters the arithmetic.
+        hot_iso = np.equal(hot_kind, StreamKind.CONDENSING)
+        cold_iso = np.equal(cold_kind, StreamKind.CONDENSING)
+        if np.any(hot_iso & cold_iso):
+            raise ValueError("At most one stream can be isothermal.")
+        iso = hot_iso | cold_iso
+        if not np.any(iso):
+            eps = effectiveness_ntu_vec(C_hot, C_cold, UA, flow_arrangement=fa)
+        else:
+            if not (np.all((C_hot > 0.0) | hot_iso) and np.all((C_cold > 0.0) | cold_iso)):
+                raise ValueError("C_hot and C_cold must be positive.")
+            C_sensible = np.where(hot_iso, C_cold, C_hot)
+            eps = -np.expm1(-UA / C_sensible)
+            if not np.all(iso):
+                # Mixed kinds: any positive C on the isothermal rows keeps
+                # the general ε finite; those rows take the closed form.
+                eps_ntu = effectiveness_ntu_vec(
+                    np.where(hot_iso, 1.0, C_hot),
+                    np.where(cold_iso, 1.0, C_cold),
+                    UA,
+                    flow_arrangement=fa,
+                )
+                eps = np.where(iso, eps, eps_ntu)
 
-        # --------------------------------------------------------------
-        # ε–NTU thermal duty
-        # --------------------------------------------------------------
-        eps = effectiveness_ntu(
-            C_hot=hot_stream.capacity_rate(),
-            C_cold=cold_stream.capacity_rate(),
-            UA=UA,
-            flow_arrangement=flow_arrangement,
+        Q, T_hot_out, T_cold_out = heat_duty_from_effectiveness_vec(
+            eps, C_hot, T_hot_in, C_cold, T_cold_in,
+            hot_kind=hot_kind,
+            cold_kind=cold_kind,
         )
 
-        Q, T_hot_out, T_cold_out = heat_duty_from_effectiveness(
-            eps=eps,
-            hot_stream=hot_stream,
-            cold_stream=cold_stream,
+        per_point = {
+            "UA": UA, "eps": eps, "Q": Q, "T_hot_out": T_hot_out, "T_cold_out": T_cold_out,
+            "v_i": v_i, "Re_i": Re_i, "Pr_i": Pr_i, "h_i": h_i, "f_i": f_i,
+            "dp_i_total": dp_i_total, "dp_i_tubes": dp_i_tubes, "dp_i_inlet": dp_i_in,
+            "dp_i_outlet": dp_i_out, "dp_i_turns": dp_i_turns,
+            "v_o": v_o, "Re_o": Re_o, "Pr_o": Pr_o, "h_o": h_o_used, "dp_o": dp_o,
+        }
+        shape = np.broadcast_shapes(
+            T_hot_in.shape, T_cold_in.shape, *(np.shape(value) for value in per_point.values())
         )
 
-        return HXResult(
+        return HXBatchResult(
             A_i=A_i,
             A_o=A_o,
             A_frontal=A_frontal,
-            UA=UA,
-            eps=eps,
-            Q=Q,
-            T_hot_out=T_hot_out,
-            T_cold_out=T_cold_out,
-            tube_side_thermal=tube_thermal,
-            tube_side_hydraulic=tube_hyd,
-            outside_side_thermal=outside_thermal,
-            outside_side_hydraulic=outside_hyd,
+            **{key: np.broadcast_to(value, shape) for key, value in per_point.items()},
+        )
+
+    def _solve_batch_parallel(
+        self,
+        shape: tuple[int, ...],
+        C_hot: np.ndarray,
+        T_hot_in: np.ndarray,
+        C_cold: np.ndarray,
+        T_cold_in: np.ndarray,
+        *,
+        m_dot_tube_side: np.ndarray,
+        tube_side_props: FluidProps | FluidPropsArray,
+        m_dot_outside: np.ndarray | None,
+        outside_props: FluidProps | FluidPropsArray | None,
+        zeta_dp_outside: float,
+        K_inlet: float,
+        K_outlet: float,
+        K_turn: float,
+        h_o: np.ndarray | None,
+        flow_arrangement: FlowArrangement,
+        hot_kind: StreamKind | np.ndarray,
+        cold_kind: StreamKind | np.ndarray,
+    ) -> HXBatchResult:
+        """
+        `solve_batch` through `_solve_core_batch` (Numba, parallel).
+
+        All inputs are validated here with the messages of `solve`, then
+        every operating point runs the same compiled core as `solve`.
+        """
+        g = self._geom
+
+        def flat(x) -> np.ndarray:
+            return np.ascontiguousarray(np.broadcast_to(np.asarray(x, dtype=float), shape)).ravel()
+
+        m_dot_t = flat(m_dot_tube_side)
+        rho_t, mu_t, k_t, cp_t = (
+            flat(x) for x in (tube_side_props.rho, tube_side_props.mu, tube_side_props.k, tube_side_props.cp)
+        )
+        if not (np.all(rho_t > 0.0) and np.all(mu_t > 0.0) and np.all(k_t > 0.0) and np.all(cp_t > 0.0)):
+            raise ValueError("rho, mu, k and cp must be positive.")
+        if K_inlet < 0.0 or K_outlet < 0.0 or K_turn < 0.0:
+            raise ValueError("K_in, K_out and K_turn must be non-negative.")
+
+        have_outside = (m_dot_outside is not None) and (outside_props is not None)
+        if have_outside:
+            D_o = self._outer_diameter()
+            m_dot_o = flat(m_dot_outside)
+            rho_o, mu_o, k_o, cp_o = (
+                flat(x) for x in (outside_props.rho, outside_props.mu, outside_props.k, outside_props.cp)
+            )
+            if not np.all(m_dot_o > 0.0):
+                raise ValueError("m_dot must be positive.")
+            if not zeta_dp_outside > 0.0:
+                raise ValueError("zeta_dp must be positive.")
+            if not (np.all(rho_o > 0.0) and np.all(mu_o > 0.0) and np.all(k_o > 0.0) and np.all(cp_o > 0.0)):
+                raise ValueError("rho, mu, k and cp must be positive.")
+        else:
+            D_o = math.nan
+            m_dot_o = rho_o = mu_o = k_o = cp_o = np.full(m_dot_t.shape, math.nan)
+
+        if h_o is not None:
+            h_o_override = flat(h_o)
+            if not np.all(h_o_override > 0.0):
+                raise ValueError("h_o must be positive when provided.")
+        else:
+            if not have_outside:
+                raise ValueError(
+                    "Outside side not specified. Provide either:\n"
+                    "- (m_dot_outside and outside_props) to compute h_o, or\n"
+                    "- h_o directly as an override."
+                )
+            h_o_override = np.full(m_dot_t.shape, math.nan)
+
+        hot_iso = np.ascontiguousarray(np.broadcast_to(np.equal(hot_kind, StreamKind.CONDENSING), shape)).ravel()
+        cold_iso = np.ascontiguousarray(np.broadcast_to(np.equal(cold_kind, StreamKind.CONDENSING), shape)).ravel()
+        if np.any(hot_iso & cold_iso):
+            raise ValueError("At most one stream can be isothermal.")
+        C_h = flat(C_hot)
+        C_c = flat(C_cold)
+        if not (np.all((C_h > 0.0) | hot_iso) and np.all((C_c > 0.0) | cold_iso)):
+            raise ValueError("C_hot and C_cold must be positive.")
+
+        out = _solve_core_batch(
+            m_dot_t, m_dot_o, h_o_override, have_outside,
+            g.A_i, g.A_o, g.A_frontal, g.D_h, g.flow_area_pass, g.L_int,
+            float(g.n_turns), g.n_rows, D_o,
+            rho_t, mu_t, k_t, cp_t, rho_o, mu_o, k_o, cp_o,
+            float(zeta_dp_outside), g.R_w, float(K_inlet), float(K_outlet), float(K_turn),
+            C_h, C_c, hot_iso, cold_iso, flat(T_hot_in), flat(T_cold_in), int(flow_arrangement),
+        )
+        out.flags.writeable = False
+
+        return HXBatchResult(
+            A_i=g.A_i,
+            A_o=g.A_o,
+            A_frontal=g.A_frontal,
+            **{
+                name: out[:, j].reshape(shape)
+                for j, name in enumerate(_CORE_FIELDS)
+                if name in HXBatchResult._fields
+            },
         )
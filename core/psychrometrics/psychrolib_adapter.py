@@ -1,10 +1,98 @@
+import functools
+
+import numpy as np
 import psychrolib
 
 psychrolib.SetUnitSystem(psychrolib.SI)
 
+# Module-level bindings for the per-call path
+_get_vap_pres_from_rel_hum = psychrolib.GetVapPresFromRelHum
+_get_hum_ratio_from_vap_pres = psychrolib.GetHumRatioFromVapPres
+_get_moist_air_enthalpy = psychrolib.GetMoistAirEnthalpy
+_ZERO_C_K = 273.15
+
+# Saturation pressure table for the vectorized path: ln(p_ws) on a fine
+# dry-bulb grid over PsychroLib's validity range [-100, 200] °C. ln(p_ws) is
+# nearly linear in T, so linear interpolation stays within ~1e-7 relative
+# error. The triple point (ice/water formula switch) is a grid node.
+_T_MIN_C = -100.0
+_T_MAX_C = 200.0
+_T_TABLE_STEP_C = 0.05
+_TRIPLE_POINT_WATER_C = 0.01
+
+# PsychroLib's lower bound on the humidity ratio [kg_H2O/kg_dry_air]
+_MIN_HUM_RATIO = 1e-7
+
+
 def moist_air_enthalpy(T: float, RH: float, p: float) -> float:
     """
     Specific enthalpy of moist air [J/kg dry air].
+
+    Parameters
+    ----------
+    T : float
+        Dry-bulb temperature [K].
+    RH : float
+        Relative humidity [-], in [0, 1].
+    p : float
+        Atmospheric pressure [Pa].
+
+    Raises
+    ------
+    ValueError
+        If `p` is not positive, or the vapor partial pressure RH * p_ws(T)
+        reaches `p` (no moist-air state; PsychroLib alone would clamp the
+        humidity ratio to its lower bound).
+    """
+    if not p > 0.0:
+        raise ValueError("Atmospheric pressure must be positive.")
+
+    T_c = T - _ZERO_C_K
+    # Same two steps as psychrolib.GetHumRatioFromRelHum, with p_w checked
+    p_w = _get_vap_pres_from_rel_hum(T_c, RH)
+    if not p_w < p:
+        raise ValueError("Water vapor partial pressure must be below the atmospheric pressure.")
+    W = _get_hum_ratio_from_vap_pres(p_w, p)
+    return _get_moist_air_enthalpy(T_c, W)  # SI: already J/kg
+
+
+@functools.lru_cache(maxsize=1)
+def _ln_sat_vap_pres_table() -> tuple[np.ndarray, np.ndarray]:
+    """(T [°C], ln(p_ws [Pa])) nodes, built from PsychroLib on first use."""
+    n = int(round((_T_MAX_C - _T_MIN_C) / _T_TABLE_STEP_C)) + 1
+    T_grid = np.union1d(np.linspace(_T_MIN_C, _T_MAX_C, n), [_TRIPLE_POINT_WATER_C])
+    ln_pws = np.log([psychrolib.GetSatVapPres(t) for t in T_grid.tolist()])
+    return T_grid, ln_pws
+
+
+def moist_air_enthalpy_vec(T: np.ndarray, RH: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `moist_air_enthalpy` [J/kg dry air].
+
+    `T` [K], `RH` [-] and `p` [Pa] may be scalars or NumPy arrays and are
+    broadcast against each other. The saturation pressure is interpolated
+    from a table built once from PsychroLib; humidity ratio and enthalpy use
+    the exact ASHRAE relations (Fundamentals 2017, ch. 1 eqns 20, 22, 30),
+    so the pressure dependence is not tabulated.
+
+    Raises `ValueError` under the same conditions as `moist_air_enthalpy`.
     """
-    h = psychrolib.GetMoistAirEnthalpy(T - 273.15, RH, p)
-    return h * 1000.0  # kJ/kg -> J/kg
+    T_c = np.asarray(T, dtype=float) - _ZERO_C_K
+    RH = np.asarray(RH, dtype=float)
+    p = np.asarray(p, dtype=float)
+
+    if np.any(T_c < _T_MIN_C) or np.any(T_c > _T_MAX_C):
+        raise ValueError("Dry bulb temperature must be in range [-100, 200]°C")
+    if np.any(RH < 0.0) or np.any(RH > 1.0):
+        raise ValueError("Relative humidity is outside range [0, 1]")
+    if not np.all(p > 0.0):
+        raise ValueError("Atmospheric pressure must be positive.")
+
+    T_grid, ln_pws = _ln_sat_vap_pres_table()
+    p_w = RH * np.exp(np.interp(T_c, T_grid, ln_pws))
+    if not np.all(p_w < p):
+        raise ValueError("Water vapor partial pressure must be below the atmospheric pressure.")
+
+    W = np.maximum(0.621945 * p_w / (p - p_w), _MIN_HUM_RATIO)
+
+    return (1.006 * T_c + W * (2501.0 + 1.86 * T_c)) * 1000.0
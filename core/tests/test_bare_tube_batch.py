@@ -0,0 +1,281 @@
+# KalKalori — Heat Exchanger Open Engine
+# GNU GPL v3 only
+
+"""
+`BareTubeHeatExchanger.solve_batch` against a loop of `solve` calls, on the
+NumPy pipeline and on the parallel compiled path.
+
+Run the suite with ``KALKALORI_DISABLE_JIT=1`` for the pure-Python kernels;
+`test_without_jit` does this for this module.
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import core.models.bare_tube as bt
+from core._jit import HAVE_NUMBA
+from core.geometry.bundle import TubeBundle
+from core.geometry.tube import BareTube
+from core.heat_transfer import FluidProps, FluidPropsArray, StreamKind
+from core.heat_transfer.streams import CondensingSteamStream, SensibleHeatStream
+from core.models import BareTubeHeatExchanger
+
+WATER = FluidProps(rho=973.0, mu=3.6e-4, k=0.67, cp=4196.0)
+AIR = FluidProps(rho=1.2, mu=2e-5, k=0.03, cp=1026.4)
+RTOL = 1e-13
+N = 40
+
+FLOW_ARRANGEMENTS = ("counterflow", "cocurrentflow", "crossflow")
+
+
+def _exchanger(flow_arrangement: str = "crossflow") -> BareTubeHeatExchanger:
+    tube = BareTube(D_i=0.015, D_o=0.018, length_total=1.34, length_effective=1.33)
+    bundle = TubeBundle(
+        tube=tube,
+        n_rows=4,
+        n_tubes_per_row=20,
+        pitch_transverse=0.025,
+        pitch_longitudinal=0.025,
+        layout="inline",
+        n_passes_tube=2,
+        flow_arrangement=flow_arrangement,
+    )
+    return BareTubeHeatExchanger(bundle=bundle, wall_k=16.0)
+
+
+@pytest.fixture(params=["numpy", "parallel"])
+def path(request, monkeypatch):
+    """Force one `solve_batch` path and check that it was taken."""
+    calls = []
+    parallel = bt.BareTubeHeatExchanger._solve_batch_parallel
+
+    def spy(self, *args, **kwargs):
+        calls.append(1)
+        return parallel(self, *args, **kwargs)
+
+    monkeypatch.setattr(bt.BareTubeHeatExchanger, "_solve_batch_parallel", spy)
+    if request.param == "numpy":
+        monkeypatch.setattr(bt, "_PARALLEL_MIN_POINTS", sys.maxsize)
+    else:
+        if not HAVE_NUMBA:
+            pytest.skip("parallel path needs Numba")
+        # Any batch size, also on single-core machines
+        monkeypatch.setattr(bt, "_PARALLEL_MIN_POINTS", 1)
+        monkeypatch.setattr(bt.numba, "get_num_threads", lambda: 2)
+
+    yield request.param
+    assert bool(calls) == (request.param == "parallel")
+
+
+def _operating_points(seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    return {
+        "m_dot_w": rng.uniform(0.02, 4.0, N),  # laminar to turbulent
+        "m_dot_a": rng.uniform(0.5, 10.0, N),
+        "T_hot": rng.uniform(330.0, 380.0, N),
+        "T_cold": rng.uniform(270.0, 300.0, N),
+        "rho_a": rng.uniform(1.0, 1.3, N),
+    }
+
+
+def _assert_matches_solve(hx, batch, idx, hot, cold, **kwargs):
+    r = hx.solve(hot, cold, **kwargs)
+    expected = {
+        "UA": r.UA, "eps": r.eps, "Q": r.Q, "T_hot_out": r.T_hot_out, "T_cold_out": r.T_cold_out,
+        "v_i": r.tube_side_thermal.v, "Re_i": r.tube_side_thermal.Re,
+        "Pr_i": r.tube_side_thermal.Pr, "h_i": r.tube_side_thermal.h,
+        "f_i": r.tube_side_hydraulic.f, "dp_i_total": r.tube_side_hydraulic.dp_total,
+        "dp_i_tubes": r.tube_side_hydraulic.dp_tubes, "dp_i_inlet": r.tube_side_hydraulic.dp_inlet,
+        "dp_i_outlet": r.tube_side_hydraulic.dp_outlet, "dp_i_turns": r.tube_side_hydraulic.dp_turns,
+        "v_o": r.outside_side_thermal.v, "Re_o": r.outside_side_thermal.Re,
+        "Pr_o": r.outside_side_thermal.Pr, "h_o": r.outside_side_thermal.h,
+        "dp_o": r.outside_side_hydraulic.dp_total,
+    }
+    for key, ref in expected.items():
+        value = getattr(batch, key)[idx]
+        assert value == pytest.approx(ref, rel=RTOL, nan_ok=True), (key, idx)
+
+
+@pytest.mark.parametrize("flow_arrangement", FLOW_ARRANGEMENTS)
+def test_sensible_streams(path, flow_arrangement):
+    hx = _exchanger(flow_arrangement)
+    op = _operating_points()
+    C_hot = 3.0 * WATER.cp
+    C_cold = op["m_dot_a"] * AIR.cp
+    b = hx.solve_batch(
+        C_hot, op["T_hot"], C_cold, op["T_cold"],
+        m_dot_tube_side=op["m_dot_w"],
+        tube_side_props=WATER,
+        m_dot_outside=op["m_dot_a"],
+        outside_props=FluidPropsArray(rho=op["rho_a"], mu=AIR.mu, k=AIR.k, cp=AIR.cp),
+    )
+    assert b.Q.shape == (N,)
+
+    for i in range(N):
+        _assert_matches_solve(
+            hx, b, i,
+            SensibleHeatStream(C=C_hot, T_in=op["T_hot"][i]),
+            SensibleHeatStream(C=C_cold[i], T_in=op["T_cold"][i]),
+            m_dot_tube_side=op["m_dot_w"][i],
+            tube_side_props=WATER,
+            m_dot_outside=op["m_dot_a"][i],
+            outside_props=FluidProps(op["rho_a"][i], AIR.mu, AIR.k, AIR.cp),
+        )
+
+
+@pytest.mark.parametrize("flow_arrangement", FLOW_ARRANGEMENTS)
+def test_condensing_hot_side_scalar_kind(path, flow_arrangement):
+    hx = _exchanger(flow_arrangement)
+    op = _operating_points(1)
+    C_cold = op["m_dot_a"] * AIR.cp
+    b = hx.solve_batch(
+        np.inf, op["T_hot"], C_cold, op["T_cold"],
+        m_dot_tube_side=op["m_dot_w"],
+        tube_side_props=WATER,
+        m_dot_outside=op["m_dot_a"],
+        outside_props=AIR,
+        hot_kind=StreamKind.CONDENSING,
+    )
+    np.testing.assert_array_equal(b.T_hot_out, op["T_hot"])
+
+    for i in range(N):
+        _assert_matches_solve(
+            hx, b, i,
+            CondensingSteamStream(T_sat=op["T_hot"][i]),
+            SensibleHeatStream(C=C_cold[i], T_in=op["T_cold"][i]),
+            m_dot_tube_side=op["m_dot_w"][i],
+            tube_side_props=WATER,
+            m_dot_outside=op["m_dot_a"][i],
+            outside_props=AIR,
+        )
+
+
+@pytest.mark.parametrize("flow_arrangement", FLOW_ARRANGEMENTS)
+def test_mixed_kinds_per_point(path, flow_arrangement):
+    hx = _exchanger(flow_arrangement)
+    op = _operating_points(2)
+    condensing = np.arange(N) % 3 == 0
+    hot_kind = np.where(condensing, StreamKind.CONDENSING, StreamKind.SENSIBLE)
+    # The C of a condensing point is never used, whatever its value
+    C_hot = np.where(condensing, np.nan, 2.0 * WATER.cp)
+    C_cold = op["m_dot_a"] * AIR.cp
+    b = hx.solve_batch(
+        C_hot, op["T_hot"], C_cold, op["T_cold"],
+        m_dot_tube_side=op["m_dot_w"],
+        tube_side_props=WATER,
+        m_dot_outside=op["m_dot_a"],
+        outside_props=AIR,
+        hot_kind=hot_kind,
+    )
+    assert np.all(np.isfinite(b.Q))
+
+    for i in range(N):
+        if condensing[i]:
+            hot = CondensingSteamStream(T_sat=op["T_hot"][i])
+        else:
+            hot = SensibleHeatStream(C=C_hot[i], T_in=op["T_hot"][i])
+        _assert_matches_solve(
+            hx, b, i,
+            hot,
+            SensibleHeatStream(C=C_cold[i], T_in=op["T_cold"][i]),
+            m_dot_tube_side=op["m_dot_w"][i],
+            tube_side_props=WATER,
+            m_dot_outside=op["m_dot_a"][i],
+            outside_props=AIR,
+        )
+
+
+def test_h_o_override(path):
+    hx = _exchanger()
+    op = _operating_points(3)
+    h_o = np.linspace(20.0, 200.0, N)
+    b = hx.solve_batch(
+        3.0e4, op["T_hot"], 5.0e3, op["T_cold"],
+        m_dot_tube_side=op["m_dot_w"],
+        tube_side_props=WATER,
+        h_o=h_o,
+    )
+    np.testing.assert_array_equal(b.h_o, h_o)
+    assert np.all(np.isnan(b.dp_o))
+
+    for i in range(N):
+        _assert_matches_solve(
+            hx, b, i,
+            SensibleHeatStream(C=3.0e4, T_in=op["T_hot"][i]),
+            SensibleHeatStream(C=5.0e3, T_in=op["T_cold"][i]),
+            m_dot_tube_side=op["m_dot_w"][i],
+            tube_side_props=WATER,
+            h_o=h_o[i],
+        )
+
+
+def test_2d_broadcast(path):
+    hx = _exchanger("counterflow")
+    m_dot_w = np.array([0.05, 0.5, 2.0, 4.0]).reshape(-1, 1)
+    T_hot = np.array([340.0, 360.0, 380.0])
+    b = hx.solve_batch(
+        2.0e4, T_hot, 8.0e3, 290.0,
+        m_dot_tube_side=m_dot_w,
+        tube_side_props=WATER,
+        m_dot_outside=8.0e3 / AIR.cp,
+        outside_props=AIR,
+    )
+    for key in ("UA", "Q", "T_hot_out", "h_i", "dp_i_total", "h_o", "dp_o"):
+        assert getattr(b, key).shape == (4, 3), key
+
+    for i, j in np.ndindex(4, 3):
+        _assert_matches_solve(
+            hx, b, (i, j),
+            SensibleHeatStream(C=2.0e4, T_in=T_hot[j]),
+            SensibleHeatStream(C=8.0e3, T_in=290.0),
+            m_dot_tube_side=m_dot_w[i, 0],
+            tube_side_props=WATER,
+            m_dot_outside=8.0e3 / AIR.cp,
+            outside_props=AIR,
+        )
+
+
+def test_nan_capacity_rate_raises(path):
+    # A sensible point with an unset C is rejected on both paths
+    hx = _exchanger()
+    with pytest.raises(ValueError, match="C_hot and C_cold must be positive."):
+        hx.solve_batch(
+            np.array([3.0e4, np.nan]), 373.15, 3.0e3, 290.0,
+            m_dot_tube_side=1.0,
+            tube_side_props=WATER,
+            h_o=50.0,
+        )
+
+
+def test_invalid_flow_arrangement_with_isothermal_side():
+    # Parsed before dispatch: an all-isothermal batch never reaches ε–NTU
+    hx = _exchanger()
+    with pytest.raises(ValueError, match="Unsupported flow_arrangement: bogus"):
+        hx.solve_batch(
+            np.inf, 373.15, 3.0e3, np.full(N, 290.0),
+            m_dot_tube_side=1.0,
+            tube_side_props=WATER,
+            h_o=50.0,
+            hot_kind=StreamKind.CONDENSING,
+            flow_arrangement="bogus",
+        )
+
+
+@pytest.mark.skipif(
+    os.environ.get("KALKALORI_DISABLE_JIT") == "1", reason="already running without JIT",
+)
+def test_without_jit():
+    # The JIT switch is read at import time: rerun this module in a fresh process
+    env = dict(os.environ, KALKALORI_DISABLE_JIT="1")
+    proc = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", __file__],
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
@@ -0,0 +1,62 @@
+# KalKalori — Heat Exchanger Open Engine
+# GNU GPL v3 only
+
+"""
+Tube-side correlations: `FluidPropsArray` validation and the NumPy fallback
+of `nusselt_internal_vec`.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+import core.heat_transfer.internal_flow as internal_flow
+from core.heat_transfer import FluidPropsArray
+from core.heat_transfer.internal_flow import nusselt_internal, nusselt_internal_vec
+
+
+@pytest.mark.parametrize("field", ["rho", "mu", "k", "cp"])
+@pytest.mark.parametrize("bad", [np.nan, 0.0, -1.0])
+def test_fluid_props_array_rejects_non_positive(field, bad):
+    values = {"rho": 973.0, "mu": 3.6e-4, "k": 0.67, "cp": 4196.0}
+    values[field] = np.array([values[field], bad])
+    with pytest.raises(ValueError, match="rho, mu, k and cp must be positive."):
+        FluidPropsArray(**values)
+
+
+def test_fluid_props_array_broadcasts():
+    props = FluidPropsArray(rho=[1.0, 1.1, 1.2], mu=2e-5, k=0.03, cp=1026.4)
+    for x in (props.rho, props.mu, props.k, props.cp):
+        assert x.shape == (3,)
+
+
+@pytest.fixture(params=["numpy", "jit"])
+def nusselt_path(request, monkeypatch):
+    if request.param == "numpy":
+        # The vec functions pick their implementation at call time
+        monkeypatch.setattr(internal_flow, "HAVE_NUMBA", False)
+    elif not internal_flow.HAVE_NUMBA:
+        pytest.skip("compiled ufuncs need Numba")
+    return request.param
+
+
+def test_nusselt_internal_vec_matches_scalar(nusselt_path):
+    # Laminar, both blend edges, transitional and turbulent
+    Re = np.array([1.0, 500.0, 2299.0, 2300.0, 3000.0, 4000.0, 4001.0, 1e4, 1e6])
+    Pr = np.array([0.7, 7.0, 80.0]).reshape(-1, 1)
+    Nu = nusselt_internal_vec(Re, Pr)
+    assert Nu.shape == (3, Re.size)
+    for i, j in np.ndindex(Nu.shape):
+        assert Nu[i, j] == pytest.approx(nusselt_internal(Re[j], Pr[i, 0]), rel=1e-15, abs=0.0)
+
+
+def test_nusselt_internal_vec_laminar_without_warnings(nusselt_path):
+    # Gnielinski at Re -> 0 and Pr = 1 overflows to inf * 0; laminar elements
+    # must not evaluate it
+    Re = np.array([1e-310, 1e-3, 500.0, 1e4])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        Nu = nusselt_internal_vec(Re, 1.0)
+    np.testing.assert_array_equal(Nu[:3], 3.66)
+    assert np.isfinite(Nu[3])
@@ -0,0 +1,108 @@
+# KalKalori — Heat Exchanger Open Engine
+# GNU GPL v3 only
+
+"""
+Counterflow ε–NTU (expm1 form): balanced limit, near-balanced streams and
+scalar / vectorized agreement.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from core.heat_transfer.ntu import (
+    _eps_cocurrentflow,
+    _eps_cocurrentflow_kernel,
+    _eps_counterflow,
+    _eps_counterflow_kernel,
+    effectiveness_ntu,
+    effectiveness_ntu_vec,
+)
+
+NTUS = (0.1, 1.0, 3.0, 20.0)
+C_MIN = 2000.0  # [W/K]
+
+
+def _eps(C_r: float, NTU: float) -> float:
+    # Hot side is C_min; C_cold = C_min / C_r
+    return effectiveness_ntu(
+        C_hot=C_MIN, C_cold=C_MIN / C_r, UA=NTU * C_MIN, flow_arrangement="counterflow",
+    )
+
+
+def _eps_textbook(C_r: float, NTU: float) -> float:
+    # Incropera: eps = (1 - e) / (1 - C_r*e),  e = exp(-NTU*(1 - C_r))
+    e = math.exp(-NTU * (1.0 - C_r))
+    return (1.0 - e) / (1.0 - C_r * e)
+
+
+@pytest.mark.parametrize("NTU", NTUS)
+def test_counterflow_balanced_exact(NTU):
+    assert _eps(1.0, NTU) == pytest.approx(NTU / (1.0 + NTU), rel=1e-15)
+
+
+@pytest.mark.parametrize("NTU", NTUS)
+def test_counterflow_near_balanced(NTU):
+    # The textbook form cancels catastrophically here; the expm1 form does not
+    eps = _eps(1.0 - 1e-12, NTU)
+    assert eps == pytest.approx(NTU / (1.0 + NTU), rel=1e-10)
+    assert eps <= 1.0
+
+
+@pytest.mark.parametrize("NTU", NTUS)
+def test_counterflow_half_capacity_ratio(NTU):
+    assert _eps(0.5, NTU) == pytest.approx(_eps_textbook(0.5, NTU), rel=1e-14)
+
+
+def test_counterflow_tends_to_balanced_limit():
+    NTU = 3.0
+    limit = NTU / (1.0 + NTU)
+    for k in range(3, 16):
+        one_minus_C_r = 10.0 ** -k
+        # |d eps / d C_r| at C_r = 1 is NTU^2 / (2 (1 + NTU)^2) < NTU^2
+        assert abs(_eps(1.0 - one_minus_C_r, NTU) - limit) <= NTU * NTU * one_minus_C_r
+
+
+@pytest.mark.parametrize("flow_arrangement", ["counterflow", "cocurrentflow", "crossflow"])
+def test_vec_matches_scalar(flow_arrangement):
+    C_r = np.array([1.0, 1.0 - 1e-12, 1.0 - 1e-6, 0.5, 0.01])
+    NTU = np.array(NTUS).reshape(-1, 1)
+    C_hot = np.full_like(C_r, C_MIN)
+    C_cold = C_MIN / C_r
+
+    # Both orientations: hot side as C_min and as C_max
+    for C_a, C_b in ((C_hot, C_cold), (C_cold, C_hot)):
+        UA = NTU * np.minimum(C_a, C_b)
+        eps = effectiveness_ntu_vec(C_a, C_b, UA, flow_arrangement=flow_arrangement)
+        assert eps.shape == (len(NTUS), C_r.size)
+        for i, j in np.ndindex(eps.shape):
+            ref = effectiveness_ntu(
+                C_hot=C_a[j], C_cold=C_b[j], UA=UA[i, j], flow_arrangement=flow_arrangement,
+            )
+            assert eps[i, j] == pytest.approx(ref, rel=1e-15, abs=0.0)
+
+
+@pytest.mark.parametrize(
+    ("C_hot", "C_cold", "UA", "match"),
+    [
+        ([np.nan, 1.0], 1.0, 1.0, "C_hot and C_cold must be positive."),
+        (1.0, [1.0, np.nan], 1.0, "C_hot and C_cold must be positive."),
+        (1.0, 1.0, [np.nan], "UA must be positive."),
+        (1.0, 1.0, [0.0, 1.0], "UA must be positive."),
+    ],
+)
+def test_vec_rejects_nan_and_non_positive(C_hot, C_cold, UA, match):
+    with pytest.raises(ValueError, match=match):
+        effectiveness_ntu_vec(C_hot, C_cold, UA)
+
+
+@pytest.mark.parametrize(
+    ("plain", "kernel"),
+    [(_eps_counterflow, _eps_counterflow_kernel), (_eps_cocurrentflow, _eps_cocurrentflow_kernel)],
+)
+def test_plain_matches_compiled_twin(plain, kernel):
+    # `effectiveness_ntu` uses the plain function, `solve` the compiled one
+    for NTU in NTUS:
+        for C_r in (0.0, 0.01, 0.5, 1.0 - 1e-12, 1.0):
+            assert plain(NTU, C_r) == pytest.approx(kernel(NTU, C_r), rel=1e-15, abs=0.0)
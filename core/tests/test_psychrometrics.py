@@ -0,0 +1,48 @@
+# KalKalori — Heat Exchanger Open Engine
+# GNU GPL v3 only
+
+"""
+`moist_air_enthalpy_vec` (tabulated p_ws) against the scalar PsychroLib path.
+"""
+
+import numpy as np
+import psychrolib
+import pytest
+
+from core.psychrometrics.psychrolib_adapter import moist_air_enthalpy, moist_air_enthalpy_vec
+
+# Table range, plus both sides of the 0.01 °C triple-point node
+T_C = np.union1d(
+    np.linspace(-100.0, 200.0, 3001),
+    [-0.015, 0.0, 0.01 - 1e-6, 0.01, 0.01 + 1e-6, 0.02, 0.035],
+)
+
+
+@pytest.mark.parametrize("p", [101325.0, 2.0e6])
+@pytest.mark.parametrize("RH", [0.0, 0.3, 1.0])
+def test_vec_matches_scalar(RH, p):
+    # Keep clear of p_w -> p, where W (and h) diverges
+    ok = np.array([RH * psychrolib.GetSatVapPres(t) < 0.9 * p for t in T_C.tolist()])
+    T = T_C[ok] + 273.15
+
+    h = moist_air_enthalpy_vec(T, RH, p)
+    assert h.shape == T.shape
+    for T_i, h_i in zip(T.tolist(), h.tolist()):
+        # ln p_ws interpolation error of the 0.05 K table
+        assert h_i == pytest.approx(moist_air_enthalpy(T_i, RH, p), rel=5e-7, abs=1e-3)
+
+
+@pytest.mark.parametrize(
+    ("T", "RH", "p", "match"),
+    [
+        (300.0, 0.5, 0.0, "Atmospheric pressure must be positive."),
+        (300.0, 0.5, -1.0, "Atmospheric pressure must be positive."),
+        (300.0, 0.5, 1000.0, "Water vapor partial pressure must be below"),
+        (373.15, 1.0, 101325.0, "Water vapor partial pressure must be below"),
+    ],
+)
+def test_invalid_pressure_raises(T, RH, p, match):
+    with pytest.raises(ValueError, match=match):
+        moist_air_enthalpy(T, RH, p)
+    with pytest.raises(ValueError, match=match):
+        moist_air_enthalpy_vec(np.array([290.0, T]), RH, p)
@@ -0,0 +1,128 @@
+# KalKalori — Heat Exchanger Open Engine
+# GNU GPL v3 only
+
+"""
+`design_sweep` / `sweep_designs` against the scalar building blocks.
+"""
+
+import numpy as np
+import pytest
+
+from core.geometry.tube import BareTube
+from core.heat_transfer.fluid_props import FluidProps
+from core.heat_transfer.internal_flow import thermo_hydraulic_internal
+from core.heat_transfer.internal_pressure_drop import (
+    pressure_drop_internal_total,
+    pressure_drop_internal_total_vec,
+)
+from core.heat_transfer.ntu import effectiveness_ntu
+from core.heat_transfer.sweeps import design_sweep, sweep_designs
+
+WATER = FluidProps(rho=973.0, mu=3.6e-4, k=0.67, cp=4196.0)
+RTOL = 1e-12
+
+KEYS = ("v", "Re", "Pr", "f", "Nu", "h", "dp_friction", "eps", "Q", "T_tube_out", "T_outside_out")
+
+
+def _tube(D_i: float) -> BareTube:
+    return BareTube(D_i=D_i, D_o=D_i + 0.003, length_total=2.0, length_effective=2.0)
+
+
+def _design_sweep(m_dot, D_i, UA):
+    return design_sweep(
+        m_dot, D_i, UA,
+        props=WATER,
+        n_tubes_per_pass=12,
+        flow_length=4.0,
+        C_outside=6000.0,
+        T_tube_in=353.15,
+        T_outside_in=293.15,
+    )
+
+
+def test_design_sweep_shape_and_broadcast():
+    res = _design_sweep([0.1, 1.0, 3.0], [0.012, 0.02], [100.0, 500.0, 1000.0, 5000.0])
+
+    assert set(res) == set(KEYS)
+    for key in KEYS:
+        assert res[key].shape == (3, 2, 4), key
+
+    # Scalars are 1-element axes
+    res = _design_sweep(1.0, 0.015, 500.0)
+    for key in KEYS:
+        assert res[key].shape == (1, 1, 1), key
+
+    # h does not depend on UA: a broadcast view, equal along the UA axis
+    res = _design_sweep([0.1, 1.0], [0.012, 0.02], [100.0, 500.0])
+    np.testing.assert_array_equal(res["h"][:, :, 0], res["h"][:, :, 1])
+
+
+def test_design_sweep_rejects_2d_axis():
+    with pytest.raises(ValueError, match="D_i must be a scalar or a 1-D array."):
+        _design_sweep(1.0, [[0.01, 0.02]], 500.0)
+
+
+@pytest.mark.parametrize("bad", [0.0, -0.01, np.nan])
+def test_design_sweep_rejects_non_positive_axis(bad):
+    with pytest.raises(ValueError, match="D_i must be positive."):
+        _design_sweep(1.0, [0.015, bad], 500.0)
+
+
+def test_design_sweep_matches_scalar_point():
+    m_dot = np.array([0.05, 0.4, 3.0])  # laminar, transitional, turbulent
+    D_i = np.array([0.012, 0.02])
+    UA = np.array([200.0, 2000.0])
+    res = _design_sweep(m_dot, D_i, UA)
+
+    for i, j, k in np.ndindex(res["h"].shape):
+        flow_area = 12 * _tube(D_i[j]).flow_area
+        th = thermo_hydraulic_internal(m_dot[i], D_i[j], flow_area, 4.0, WATER)
+        for key, ref in zip(KEYS[:7], th):
+            assert res[key][i, j, k] == pytest.approx(ref, rel=RTOL), key
+
+        eps = effectiveness_ntu(
+            C_hot=m_dot[i] * WATER.cp, C_cold=6000.0, UA=UA[k], flow_arrangement="counterflow",
+        )
+        assert res["eps"][i, j, k] == pytest.approx(eps, rel=RTOL)
+
+
+def test_sweep_designs_matches_scalar_points():
+    m_dot = np.array([0.05, 0.4, 3.0, 1.2])
+    D_i = np.array([0.012, 0.015, 0.02, 0.015])
+    flow_area = np.array([8 * _tube(d).flow_area for d in D_i])
+    UA = 800.0  # broadcast against the arrays
+    res = sweep_designs(
+        m_dot, D_i, flow_area, 4.0, UA,
+        props=WATER, C_outside=6000.0, flow_arrangement="crossflow", n_turns=1,
+    )
+
+    for key in ("v", "Re", "Pr", "f", "Nu", "h", "dp_total", "eps"):
+        assert res[key].shape == (4,), key
+
+    for i in range(4):
+        th = thermo_hydraulic_internal(m_dot[i], D_i[i], flow_area[i], 4.0, WATER)
+        for key, ref in zip(("v", "Re", "Pr", "f", "Nu", "h"), th):
+            assert res[key][i] == pytest.approx(ref, rel=RTOL), key
+
+        dp = pressure_drop_internal_total(m_dot[i], flow_area[i], D_i[i], 4.0, WATER, n_turns=1)
+        assert res["dp_total"][i] == pytest.approx(dp.dp_total, rel=RTOL)
+
+        eps = effectiveness_ntu(
+            C_hot=m_dot[i] * WATER.cp, C_cold=6000.0, UA=UA, flow_arrangement="crossflow",
+        )
+        assert res["eps"][i] == pytest.approx(eps, rel=RTOL)
+
+
+def test_sweep_designs_dp_total_matches_vec():
+    m_dot = np.array([0.05, 0.4, 3.0, 1.2])
+    D_i = 0.015
+    flow_area = 8 * _tube(D_i).flow_area
+    res = sweep_designs(
+        m_dot, D_i, flow_area, 4.0, 800.0,
+        props=WATER, C_outside=6000.0, n_turns=3, K_in=0.4, K_out=0.9, K_turn=1.2,
+    )
+    dp_total = pressure_drop_internal_total_vec(
+        m_dot, flow_area, D_i, 4.0, WATER.rho, WATER.mu,
+        n_turns=3, K_in=0.4, K_out=0.9, K_turn=1.2,
+    )[0]
+    np.testing.assert_allclose(res["dp_total"], dp_total, rtol=RTOL, atol=0.0)
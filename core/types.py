@@ -0,0 +1,38 @@
+# KalKalori — Heat Exchanger Open Engine
+# GNU GPL v3 only
+
+"""
+Dependency-free tags shared by the geometry and solver layers.
+
+This module imports nothing beyond the standard library, so geometry
+definitions can use these tags without pulling in NumPy, Numba or the
+heat transfer correlations.
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+
+
+class FlowArrangement(IntEnum):
+    """
+    Flow arrangement tag for ε–NTU relations.
+
+    Parsed once (e.g. by `TubeBundle`) so that repeated ε evaluations
+    dispatch on an integer instead of normalizing and comparing strings.
+    Member names match the accepted strings ("counterflow", ...).
+    """
+
+    COUNTERFLOW = 0
+    COCURRENTFLOW = 1
+    CROSSFLOW = 2
+
+    @classmethod
+    def parse(cls, value: str | FlowArrangement) -> FlowArrangement:
+        """Return the tag for a flow arrangement string (case-insensitive) or tag."""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[value.upper()]
+        except (KeyError, AttributeError):
+            raise ValueError(f"Unsupported flow_arrangement: {value}") from None